@@ -10,7 +10,7 @@ from flask_limiter.util import get_remote_address
 
 from config.web_settings import (
     SECRET_KEY, DEBUG, HOST, PORT,
-    CORS_ORIGINS, RATE_LIMIT_STORAGE,
+    CORS_ORIGINS, RATE_LIMIT_STORAGE, RATE_LIMIT_STRATEGY, RATE_LIMIT_POOL_SIZE,
     RATE_LIMIT_GENERATE, RATE_LIMIT_ANALYZE, RATE_LIMIT_DEFAULT,
     API_PREFIX
 )
@@ -29,16 +29,26 @@ def create_app():
     
     # Configuration
     app.config['SECRET_KEY'] = SECRET_KEY
-    app.config['JSON_SORT_KEYS'] = False
+    
+    # JSON responses: keep insertion order and skip pretty-printing
+    app.json.sort_keys = False
+    app.json.compact = True
     
     # CORS
     CORS(app, origins=CORS_ORIGINS, supports_credentials=False)
     
     # Rate Limiting
+    storage_options = {}
+    if RATE_LIMIT_STORAGE.startswith(('redis://', 'rediss://')):
+        # Keep a warm connection pool instead of reconnecting per request
+        storage_options['max_connections'] = RATE_LIMIT_POOL_SIZE
+    
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
         storage_uri=RATE_LIMIT_STORAGE,
+        storage_options=storage_options,
+        strategy=RATE_LIMIT_STRATEGY,
         default_limits=[RATE_LIMIT_DEFAULT]
     )
     
@@ -77,4 +87,4 @@ if __name__ == '__main__':
     print(f"🔐 Secure Password Utility running on http://{HOST}:{PORT}")
     print(f"📡 API endpoint: http://{HOST}:{PORT}{API_PREFIX}")
     print(f"⚠️  Security: All operations in-memory only. No logging enabled.")
-    app.run(host=HOST, port=PORT, debug=DEBUG)
+    app.run(host=HOST, port=PORT, debug=DEBUG, threaded=True)
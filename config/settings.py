@@ -11,6 +11,7 @@ UI_WINDOW_HEIGHT: Final[int] = 850
 UI_PADDING: Final[int] = 20
 UI_FONT_FAMILY: Final[str] = 'Arial'
 UI_MONO_FONT: Final[str] = 'Courier'
+UI_ENTROPY_DEBOUNCE_MS: Final[int] = 50  # Quiet period before entropy refresh
 
 # Generator Configuration
 MIN_PASSWORD_LENGTH: Final[int] = 4
@@ -22,6 +23,12 @@ CSPRNG_MODULE: Final[str] = 'secrets'  # Never change this
 ALLOW_PASSWORD_HISTORY: Final[bool] = False  # Never enable
 ALLOW_PASSWORD_LOGGING: Final[bool] = False  # Never enable
 
+# Analyzer Configuration
+ANALYSIS_CACHE_SIZE: Final[int] = 256  # Results cached by keyed digest; 0 disables
+
+# Validator Configuration
+VALIDATION_CACHE_SIZE: Final[int] = 256  # Results cached by keyed digest; 0 disables
+
 # Strength Scoring Thresholds
 SCORE_WEAK_THRESHOLD: Final[int] = 40
 SCORE_MEDIUM_THRESHOLD: Final[int] = 60
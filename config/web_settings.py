@@ -16,11 +16,19 @@ PORT: Final[int] = int(os.getenv('PORT', 5000))
 CORS_ORIGINS: Final[list] = ['http://localhost:5000', 'http://127.0.0.1:5000']
 
 # Rate Limiting
-RATE_LIMIT_STORAGE: Final[str] = 'memory://'
+# memory:// keeps a separate counter per worker process; point this at a
+# shared backend (e.g. redis://localhost:6379/0) for multi-worker deployments.
+RATE_LIMIT_STORAGE: Final[str] = os.getenv('RATE_LIMIT_STORAGE', 'memory://')
+RATE_LIMIT_STRATEGY: Final[str] = 'fixed-window'  # single INCR+EXPIRE on Redis
+RATE_LIMIT_POOL_SIZE: Final[int] = int(os.getenv('RATE_LIMIT_POOL_SIZE', 50))
 RATE_LIMIT_GENERATE: Final[str] = '100 per minute'
 RATE_LIMIT_ANALYZE: Final[str] = '200 per minute'
 RATE_LIMIT_DEFAULT: Final[str] = '500 per hour'
 
+# Concurrency: cap simultaneous CPU-bound analyses per worker process
+MAX_CONCURRENT_ANALYSES: Final[int] = int(os.getenv('MAX_CONCURRENT_ANALYSES', 4))
+ANALYSIS_SLOT_TIMEOUT: Final[float] = 5.0  # seconds to wait for a free slot
+
 # API Configuration
 API_PREFIX: Final[str] = '/api/v1'
 MAX_PASSWORD_LENGTH: Final[int] = 128
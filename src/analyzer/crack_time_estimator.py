@@ -3,8 +3,39 @@ Crack time estimator for brute-force attack resistance.
 Provides realistic time estimates based on modern attack capabilities.
 """
 
+import bisect
+import functools
+import math
 from config.settings import BRUTE_FORCE_RATE
 
+# Beyond this many bits every realistic rate is 'Millennia+'; returning early
+# also keeps 2 ** entropy from overflowing a float for very long passwords.
+_MAX_ESTIMATE_ENTROPY = 200
+
+# Exclusive upper bounds (seconds) of each _TIME_FORMATS bucket
+_TIME_LIMITS = (
+    0.001, 1, 60, 3600, 86400,
+    2592000,      # 30 days
+    31536000,     # 1 year
+    3153600000,   # 100 years
+    31536000000,  # 1000 years
+)
+
+# (divisor, format) per bucket; None means the format is a fixed label.
+# Formats receive the value and its plural suffix.
+_TIME_FORMATS = (
+    (None, 'Instant'),
+    (None, 'Less than 1 second'),
+    (1, '{} seconds'),
+    (60, '{} minute{}'),
+    (3600, '{} hour{}'),
+    (86400, '{} day{}'),
+    (2592000, '{} month{}'),
+    (31536000, '{} year{}'),
+    (None, 'Centuries'),
+    (None, 'Millennia+'),
+)
+
 
 class CrackTimeEstimator:
     """
@@ -30,16 +61,7 @@ class CrackTimeEstimator:
         Returns:
             Human-readable time estimate
         """
-        if entropy <= 0:
-            return 'Instant'
-        
-        # Calculate total combinations
-        combinations = 2 ** entropy
-        
-        # Calculate average time (half the keyspace)
-        seconds = combinations / (2 * self.attempts_per_second)
-        
-        return self._format_time(seconds)
+        return _estimate_from_entropy(entropy, self.attempts_per_second)
     
     def estimate_from_length_and_charset(self, length: int, 
                                         charset_size: int) -> str:
@@ -64,7 +86,8 @@ class CrackTimeEstimator:
         
         return self._format_time(seconds)
     
-    def _format_time(self, seconds: float) -> str:
+    @staticmethod
+    def _format_time(seconds: float) -> str:
         """
         Format seconds into human-readable string.
         
@@ -74,44 +97,23 @@ class CrackTimeEstimator:
         Returns:
             Formatted string
         """
-        if seconds < 0.001:
-            return 'Instant'
-        elif seconds < 1:
-            return 'Less than 1 second'
-        elif seconds < 60:
-            return f'{int(seconds)} seconds'
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f'{minutes} minute{"s" if minutes != 1 else ""}'
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f'{hours} hour{"s" if hours != 1 else ""}'
-        elif seconds < 2592000:  # 30 days
-            days = int(seconds / 86400)
-            return f'{days} day{"s" if days != 1 else ""}'
-        elif seconds < 31536000:  # 1 year
-            months = int(seconds / 2592000)
-            return f'{months} month{"s" if months != 1 else ""}'
-        elif seconds < 3153600000:  # 100 years
-            years = int(seconds / 31536000)
-            return f'{years} year{"s" if years != 1 else ""}'
-        elif seconds < 31536000000:  # 1000 years
-            return 'Centuries'
-        else:
-            return 'Millennia+'
+        divisor, fmt = _TIME_FORMATS[bisect.bisect_right(_TIME_LIMITS, seconds)]
+        if divisor is None:
+            return fmt
+        
+        value = int(seconds / divisor)
+        return fmt.format(value, '' if value == 1 else 's')
     
-    def get_security_level(self, entropy: float) -> str:
+    def get_security_level(self, time_estimate: str) -> str:
         """
         Get security level based on crack time.
         
         Args:
-            entropy: Password entropy
+            time_estimate: Crack time string from estimate_from_entropy
         
         Returns:
             Security level description
         """
-        time_estimate = self.estimate_from_entropy(entropy)
-        
         if 'Instant' in time_estimate or 'second' in time_estimate:
             return 'Very Weak - Crackable instantly'
         elif 'minute' in time_estimate or 'hour' in time_estimate:
@@ -124,3 +126,29 @@ class CrackTimeEstimator:
             return 'Strong - Crackable in years'
         else:
             return 'Very Strong - Crackable in centuries+'
+
+
+@functools.lru_cache(maxsize=4096)
+def _estimate_from_entropy(entropy: float, attempts_per_second: int) -> str:
+    """
+    Cached crack time estimate shared by all estimator instances.
+    
+    Analyzer entropies come from a small set of (length, charset) pairs,
+    so repeated estimates are served from the cache.
+    
+    Args:
+        entropy: Password entropy in bits
+        attempts_per_second: Brute force rate
+    
+    Returns:
+        Human-readable time estimate
+    """
+    if entropy <= 0:
+        return 'Instant'
+    if entropy > _MAX_ESTIMATE_ENTROPY:
+        return 'Millennia+'
+    
+    # Average time is half the keyspace: 2 ** (entropy - 1) attempts
+    seconds = math.pow(2.0, entropy - 1) / attempts_per_second
+    
+    return CrackTimeEstimator._format_time(seconds)
@@ -3,29 +3,78 @@ Comprehensive password strength analyzer.
 Performs read-only analysis without storing passwords.
 """
 
-import re
 import math
-from typing import Dict
+import string
+from typing import Dict, List
+from ..core.digest_cache import DigestCache
 from .pattern_detector import PatternDetector
 from .strength_scorer import StrengthScorer
 from .crack_time_estimator import CrackTimeEstimator
+from config.settings import ANALYSIS_CACHE_SIZE
+
+# Character class bit flags
+_CLASS_UPPER = 1
+_CLASS_LOWER = 2
+_CLASS_DIGIT = 4
+_CLASS_SYMBOL = 8
+
+# Byte -> class flag lookup table. Anything outside ASCII letters/digits
+# (including every byte of a multi-byte UTF-8 sequence) is a symbol.
+_CLASS_TABLE = bytes(
+    _CLASS_UPPER if chr(b) in string.ascii_uppercase else
+    _CLASS_LOWER if chr(b) in string.ascii_lowercase else
+    _CLASS_DIGIT if chr(b) in string.digits else
+    _CLASS_SYMBOL
+    for b in range(256)
+)
+
+# (analysis key, recommendation) for each missing character type
+_MISSING_CLASS_RECOMMENDATIONS = (
+    ('has_uppercase', 'Add uppercase letters (A-Z)'),
+    ('has_lowercase', 'Add lowercase letters (a-z)'),
+    ('has_numbers', 'Add numbers (0-9)'),
+    ('has_symbols', 'Add symbols (!@#$...)'),
+)
+
+# (analysis key, recommendation) for each detected weak pattern
+_PATTERN_RECOMMENDATIONS = (
+    ('has_common_patterns', 'Avoid common words and patterns'),
+    ('has_sequential', 'Avoid sequential characters (abc, 123)'),
+    ('has_keyboard_patterns', 'Avoid keyboard patterns (qwerty)'),
+    ('has_repeated_chars', 'Avoid repeated characters (aaa, 111)'),
+)
+
+
+def _copy_analysis(analysis: Dict) -> Dict:
+    """Copy an analysis dict, including its list values."""
+    return {
+        name: list(value) if isinstance(value, list) else value
+        for name, value in analysis.items()
+    }
 
 
 class PasswordAnalyzer:
     """
-    Stateless password analyzer with comprehensive strength analysis.
+    Password analyzer with comprehensive strength analysis.
     
     Security Guarantee:
         - Read-only operations
         - No password storage
-        - No state maintained
+        - Only results are cached, keyed by a keyed BLAKE2b digest
     """
     
-    def __init__(self):
-        """Initialize analyzer components."""
+    def __init__(self, cache_size: int = ANALYSIS_CACHE_SIZE):
+        """
+        Initialize analyzer components.
+        
+        Args:
+            cache_size: Maximum cached results (0 disables caching)
+        """
         self.pattern_detector = PatternDetector()
         self.strength_scorer = StrengthScorer()
         self.crack_time_estimator = CrackTimeEstimator()
+        
+        self._cache: DigestCache[Dict] = DigestCache(cache_size)
     
     def analyze(self, password: str) -> Dict:
         """
@@ -55,13 +104,33 @@ class PasswordAnalyzer:
         if not password:
             return self._empty_analysis()
         
+        analysis = self._cache.get_or_compute(password, self._analyze)
+        
+        # Hand out a copy so callers cannot mutate the cached result
+        return _copy_analysis(analysis)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached analysis results."""
+        self._cache.clear()
+    
+    def _analyze(self, password: str) -> Dict:
+        """
+        Run the full analysis for a non-empty password.
+        
+        Args:
+            password: Password to analyze (not stored)
+        
+        Returns:
+            Analysis dict (see analyze)
+        """
         # Character type analysis
+        char_classes = self._classify(password)
         analysis = {
             'length': len(password),
-            'has_uppercase': bool(re.search(r'[A-Z]', password)),
-            'has_lowercase': bool(re.search(r'[a-z]', password)),
-            'has_numbers': bool(re.search(r'\d', password)),
-            'has_symbols': bool(re.search(r'[^A-Za-z0-9]', password)),
+            'has_uppercase': bool(char_classes & _CLASS_UPPER),
+            'has_lowercase': bool(char_classes & _CLASS_LOWER),
+            'has_numbers': bool(char_classes & _CLASS_DIGIT),
+            'has_symbols': bool(char_classes & _CLASS_SYMBOL),
         }
         
         # Pattern detection
@@ -89,7 +158,7 @@ class PasswordAnalyzer:
         
         # Security level
         analysis['security_level'] = self.crack_time_estimator.get_security_level(
-            analysis['entropy']
+            analysis['crack_time']
         )
         
         # Get recommendations
@@ -97,11 +166,61 @@ class PasswordAnalyzer:
         
         # Get detected pattern list
         analysis['detected_patterns'] = self.pattern_detector.get_detected_patterns(
-            password
+            patterns
         )
         
         return analysis
     
+    def analyze_many(self, passwords: List[str]) -> List[Dict]:
+        """
+        Analyze a batch of passwords.
+        
+        Each distinct password is analyzed once; duplicates in the batch
+        (common in password dumps) get their own copy of that result.
+        
+        Args:
+            passwords: Passwords to analyze (not stored)
+        
+        Returns:
+            List of analysis dicts in input order
+        """
+        analyzed: Dict[str, Dict] = {}
+        results = []
+        for password in passwords:
+            analysis = analyzed.get(password)
+            if analysis is None:
+                analysis = analyzed[password] = self.analyze(password)
+            else:
+                analysis = _copy_analysis(analysis)
+            results.append(analysis)
+        
+        return results
+    
+    @staticmethod
+    def _classify(password: str) -> int:
+        """
+        Detect character types in a single pass.
+        
+        Args:
+            password: Password string
+        
+        Returns:
+            Bitmask of _CLASS_* flags present in the password
+        """
+        codes = password.encode('utf-8', 'replace').translate(_CLASS_TABLE)
+        
+        mask = 0
+        for code in set(codes):
+            mask |= code
+        
+        # Non-ASCII decimal digits count as numbers too (matches \d)
+        if (mask & _CLASS_SYMBOL and not mask & _CLASS_DIGIT
+                and not password.isascii()):
+            if any(c.isdecimal() for c in password):
+                mask |= _CLASS_DIGIT
+        
+        return mask
+    
     def _empty_analysis(self) -> Dict:
         """Return analysis for empty password."""
         return {
@@ -175,39 +294,30 @@ class PasswordAnalyzer:
         Returns:
             List of recommendation strings
         """
+        analysis_get = analysis.get
+        length = analysis['length']
         recommendations = []
         
         # Length recommendations
-        if analysis['length'] < 8:
+        if length < 8:
             recommendations.append('Increase length to at least 8 characters')
-        elif analysis['length'] < 12:
+        elif length < 12:
             recommendations.append('Consider increasing length to 12+ characters')
         
         # Diversity recommendations
-        if not analysis['has_uppercase']:
-            recommendations.append('Add uppercase letters (A-Z)')
-        if not analysis['has_lowercase']:
-            recommendations.append('Add lowercase letters (a-z)')
-        if not analysis['has_numbers']:
-            recommendations.append('Add numbers (0-9)')
-        if not analysis['has_symbols']:
-            recommendations.append('Add symbols (!@#$...)')
+        recommendations.extend(
+            message for key, message in _MISSING_CLASS_RECOMMENDATIONS
+            if not analysis[key]
+        )
         
         # Pattern warnings
-        if analysis.get('has_common_patterns', False):
-            recommendations.append('Avoid common words and patterns')
-        if analysis.get('has_sequential', False):
-            recommendations.append('Avoid sequential characters (abc, 123)')
-        if analysis.get('has_keyboard_patterns', False):
-            recommendations.append('Avoid keyboard patterns (qwerty)')
-        if analysis.get('has_repeated_chars', False):
-            recommendations.append('Avoid repeated characters (aaa, 111)')
+        recommendations.extend(
+            message for key, message in _PATTERN_RECOMMENDATIONS
+            if analysis_get(key, False)
+        )
         
         # Entropy recommendations
         if analysis['entropy'] < 40:
             recommendations.append('Significantly increase password complexity')
         
-        if not recommendations:
-            recommendations.append('Password meets security best practices!')
-        
-        return recommendations
+        return recommendations or ['Password meets security best practices!']
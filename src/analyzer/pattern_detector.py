@@ -9,10 +9,23 @@ from ..core.constants import (
     COMMON_PATTERNS,
     SEQUENTIAL_PATTERNS,
     KEYBOARD_PATTERNS,
-    REPEATED_CHAR_PATTERN,
-    DATE_PATTERN
+    COMMON_PATTERN_RE,
+    SEQUENTIAL_PATTERN_RE,
+    KEYBOARD_PATTERN_RE,
+    REPEATED_CHAR_RE,
+    DATE_RE
 )
 
+# Display names for detect_all_patterns result keys
+_PATTERN_NAMES = {
+    'has_common_patterns': 'Common weak patterns',
+    'has_sequential': 'Sequential characters',
+    'has_keyboard_patterns': 'Keyboard patterns',
+    'has_repeated_chars': 'Repeated characters',
+    'has_date_pattern': 'Date patterns',
+    'has_number_only_suffix': 'Numbers-only suffix'
+}
+
 
 class PatternDetector:
     """
@@ -25,6 +38,16 @@ class PatternDetector:
         self.common_patterns = COMMON_PATTERNS
         self.sequential_patterns = SEQUENTIAL_PATTERNS
         self.keyboard_patterns = KEYBOARD_PATTERNS
+        
+        # Passwords shorter than every pattern in a category skip its scan
+        self._common_min_len = min(map(len, self.common_patterns))
+        self._sequential_min_len = min(map(len, self.sequential_patterns))
+        self._keyboard_min_len = min(map(len, self.keyboard_patterns))
+        
+        # Matchers compiled once at import in core.constants
+        self._common_re = COMMON_PATTERN_RE
+        self._sequential_re = SEQUENTIAL_PATTERN_RE
+        self._keyboard_re = KEYBOARD_PATTERN_RE
     
     def detect_all_patterns(self, password: str) -> Dict[str, bool]:
         """
@@ -36,10 +59,12 @@ class PatternDetector:
         Returns:
             Dict of pattern detection results
         """
+        password_lower = password.lower()
+        
         return {
-            'has_common_patterns': self.has_common_patterns(password),
-            'has_sequential': self.has_sequential_patterns(password),
-            'has_keyboard_patterns': self.has_keyboard_patterns(password),
+            'has_common_patterns': self._has_common_patterns_lc(password_lower),
+            'has_sequential': self._has_sequential_patterns_lc(password_lower),
+            'has_keyboard_patterns': self._has_keyboard_patterns_lc(password_lower),
             'has_repeated_chars': self.has_repeated_characters(password),
             'has_date_pattern': self.has_date_pattern(password),
             'has_number_only_suffix': self.has_number_suffix(password),
@@ -55,8 +80,13 @@ class PatternDetector:
         Returns:
             True if common patterns found
         """
-        password_lower = password.lower()
-        return any(pattern in password_lower for pattern in self.common_patterns)
+        return self._has_common_patterns_lc(password.lower())
+    
+    def _has_common_patterns_lc(self, password_lower: str) -> bool:
+        """Check an already-lowercased password against common patterns."""
+        if len(password_lower) < self._common_min_len:
+            return False
+        return self._common_re.search(password_lower) is not None
     
     def has_sequential_patterns(self, password: str) -> bool:
         """
@@ -68,13 +98,13 @@ class PatternDetector:
         Returns:
             True if sequential patterns found
         """
-        password_lower = password.lower()
-        
-        for pattern in self.sequential_patterns:
-            if pattern in password_lower or pattern[::-1] in password_lower:
-                return True
-        
-        return False
+        return self._has_sequential_patterns_lc(password.lower())
+    
+    def _has_sequential_patterns_lc(self, password_lower: str) -> bool:
+        """Check an already-lowercased password against sequential patterns."""
+        if len(password_lower) < self._sequential_min_len:
+            return False
+        return self._sequential_re.search(password_lower) is not None
     
     def has_keyboard_patterns(self, password: str) -> bool:
         """
@@ -86,8 +116,13 @@ class PatternDetector:
         Returns:
             True if keyboard patterns found
         """
-        password_lower = password.lower()
-        return any(pattern in password_lower for pattern in self.keyboard_patterns)
+        return self._has_keyboard_patterns_lc(password.lower())
+    
+    def _has_keyboard_patterns_lc(self, password_lower: str) -> bool:
+        """Check an already-lowercased password against keyboard patterns."""
+        if len(password_lower) < self._keyboard_min_len:
+            return False
+        return self._keyboard_re.search(password_lower) is not None
     
     def has_repeated_characters(self, password: str, min_repeat: int = 3) -> bool:
         """
@@ -100,6 +135,10 @@ class PatternDetector:
         Returns:
             True if repeated characters found
         """
+        # REPEATED_CHAR_RE is precompiled for the default min_repeat
+        if min_repeat == 3:
+            return REPEATED_CHAR_RE.search(password) is not None
+        
         pattern = r'(.)\1{' + str(min_repeat - 1) + r',}'
         return bool(re.search(pattern, password))
     
@@ -113,7 +152,10 @@ class PatternDetector:
         Returns:
             True if date patterns found
         """
-        return bool(re.search(DATE_PATTERN, password))
+        # Every date match needs a separator; skip the regex when there is none
+        if '-' not in password and '/' not in password:
+            return False
+        return DATE_RE.search(password) is not None
     
     def has_number_suffix(self, password: str) -> bool:
         """
@@ -125,32 +167,21 @@ class PatternDetector:
         Returns:
             True if ends with numbers
         """
-        return bool(re.search(r'\d+$', password))
+        # Any trailing decimal digit means a digit run ends the password
+        return bool(password) and password[-1].isdecimal()
     
-    def get_detected_patterns(self, password: str) -> List[str]:
+    def get_detected_patterns(self, results: Dict[str, bool]) -> List[str]:
         """
         Get list of all detected pattern types.
         
         Args:
-            password: Password to analyze
+            results: Pattern detection results from detect_all_patterns
         
         Returns:
             List of detected pattern names
         """
-        patterns = []
-        results = self.detect_all_patterns(password)
-        
-        pattern_names = {
-            'has_common_patterns': 'Common weak patterns',
-            'has_sequential': 'Sequential characters',
-            'has_keyboard_patterns': 'Keyboard patterns',
-            'has_repeated_chars': 'Repeated characters',
-            'has_date_pattern': 'Date patterns',
-            'has_number_only_suffix': 'Numbers-only suffix'
-        }
-        
-        for key, detected in results.items():
-            if detected:
-                patterns.append(pattern_names[key])
-        
-        return patterns
\ No newline at end of file
+        return [
+            _PATTERN_NAMES[key]
+            for key, detected in results.items()
+            if detected
+        ]
@@ -8,7 +8,50 @@ from typing import Dict
 from config.settings import (
     SCORE_WEAK_THRESHOLD,
     SCORE_MEDIUM_THRESHOLD,
-    SCORE_STRONG_THRESHOLD
+    SCORE_STRONG_THRESHOLD,
+    MAX_PASSWORD_LENGTH
+)
+
+# Entropy (whole bits) at and above which the entropy score is constant
+_MAX_SCORED_ENTROPY = 200
+
+
+def _compute_length_score(length: int) -> int:
+    """Length points (0-30) for a given password length."""
+    if length >= 20:
+        return 30
+    elif length >= 16:
+        return 28
+    elif length >= 12:
+        return 24
+    elif length >= 10:
+        return 20
+    elif length >= 8:
+        return 15
+    else:
+        return length * 2
+
+
+def _compute_entropy_score(entropy: int) -> int:
+    """Entropy points (0-30) for a whole number of bits."""
+    if entropy >= 100:
+        return 30
+    elif entropy >= 80:
+        return 28
+    elif entropy >= 60:
+        return 24
+    elif entropy >= 40:
+        return 18
+    else:
+        return entropy // 2
+
+
+# Precomputed score tables indexed by length / whole bits of entropy
+_LENGTH_SCORE = tuple(
+    _compute_length_score(i) for i in range(MAX_PASSWORD_LENGTH + 1)
+)
+_ENTROPY_SCORE = tuple(
+    _compute_entropy_score(i) for i in range(_MAX_SCORED_ENTROPY + 1)
 )
 
 
@@ -17,6 +60,13 @@ class StrengthScorer:
     Calculates comprehensive password strength scores.
     """
     
+    _COLOR_MAP = {
+        'Weak': 'red',
+        'Medium': 'orange',
+        'Strong': 'blue',
+        'Very Strong': 'green'
+    }
+    
     def calculate_score(self, password: str, analysis: Dict) -> int:
         """
         Calculate overall password strength score (0-100).
@@ -62,18 +112,7 @@ class StrengthScorer:
         Returns:
             Points (0-30)
         """
-        if length >= 20:
-            return 30
-        elif length >= 16:
-            return 28
-        elif length >= 12:
-            return 24
-        elif length >= 10:
-            return 20
-        elif length >= 8:
-            return 15
-        else:
-            return length * 2
+        return _LENGTH_SCORE[min(length, MAX_PASSWORD_LENGTH)]
     
     def _score_diversity(self, analysis: Dict) -> int:
         """
@@ -98,16 +137,8 @@ class StrengthScorer:
         Returns:
             Points (0-30)
         """
-        if entropy >= 100:
-            return 30
-        elif entropy >= 80:
-            return 28
-        elif entropy >= 60:
-            return 24
-        elif entropy >= 40:
-            return 18
-        else:
-            return int(entropy / 2)
+        # Scores only change at whole-bit thresholds, so flooring is exact
+        return _ENTROPY_SCORE[min(int(entropy), _MAX_SCORED_ENTROPY)]
     
     def _score_patterns(self, analysis: Dict) -> int:
         """
@@ -170,10 +201,4 @@ class StrengthScorer:
         Returns:
             Color name
         """
-        colors = {
-            'Weak': 'red',
-            'Medium': 'orange',
-            'Strong': 'blue',
-            'Very Strong': 'green'
-        }
-        return colors.get(strength, 'gray')
\ No newline at end of file
+        return self._COLOR_MAP.get(strength, 'gray')
\ No newline at end of file
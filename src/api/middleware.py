@@ -2,8 +2,10 @@
 Security middleware for Flask application.
 """
 
+import threading
 from functools import wraps
 from flask import request, jsonify
+from werkzeug.exceptions import BadRequest
 from config.web_settings import SECURITY_HEADERS
 
 
@@ -17,14 +19,16 @@ def add_security_headers(response):
     Returns:
         Modified response
     """
-    for header, value in SECURITY_HEADERS.items():
-        response.headers[header] = value
+    response.headers.update(SECURITY_HEADERS)
     return response
 
 
 def require_json(f):
     """
-    Decorator to require JSON content type.
+    Decorator to require a JSON object body.
+    
+    The body is parsed once here; Flask caches the result, so the
+    handler's own request.get_json() does not parse it again.
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -33,6 +37,18 @@ def require_json(f):
                 'success': False,
                 'error': 'Content-Type must be application/json'
             }), 400
+        try:
+            data = request.get_json()
+        except BadRequest:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid JSON body'
+            }), 400
+        if not isinstance(data, dict):
+            return jsonify({
+                'success': False,
+                'error': 'Request body must be a JSON object'
+            }), 400
         return f(*args, **kwargs)
     return decorated_function
 
@@ -52,3 +68,32 @@ def handle_errors(f):
                 'error': 'An internal error occurred'
             }), 500
     return decorated_function
+
+
+def limit_concurrency(max_concurrent: int, timeout: float):
+    """
+    Decorator to cap simultaneous executions of a CPU-bound handler.
+    
+    Args:
+        max_concurrent: Maximum in-flight calls per process
+        timeout: Seconds to wait for a free slot before rejecting
+    
+    Returns:
+        Decorator returning 503 when no slot frees up in time
+    """
+    slots = threading.BoundedSemaphore(max_concurrent)
+    
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not slots.acquire(timeout=timeout):
+                return jsonify({
+                    'success': False,
+                    'error': 'Server busy. Please try again later.'
+                }), 503
+            try:
+                return f(*args, **kwargs)
+            finally:
+                slots.release()
+        return decorated_function
+    return decorator
@@ -3,22 +3,27 @@ API routes for password utility.
 RESTful endpoints with security best practices.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from ..generator import PasswordGenerator
 from ..analyzer import PasswordAnalyzer
 from ..validator import PolicyValidator, PasswordPolicy
 from .validators import RequestValidator
-from .middleware import require_json, handle_errors
+from .middleware import require_json, handle_errors, limit_concurrency
+from config.web_settings import MAX_CONCURRENT_ANALYSES, ANALYSIS_SLOT_TIMEOUT
 
 api_bp = Blueprint('api', __name__)
 
-# Initialize components (stateless)
+# Initialize components (stateless: result caches are disabled, since
+# hit/miss timing would reveal passwords recently sent by other clients)
 generator = PasswordGenerator()
-analyzer = PasswordAnalyzer()
+analyzer = PasswordAnalyzer(cache_size=0)
 policy = PasswordPolicy()
-validator = PolicyValidator(policy)
+validator = PolicyValidator(policy, analyzer, cache_size=0)
 request_validator = RequestValidator()
 
+# Static health payload, serialized once
+_HEALTH = b'{"success":true,"status":"healthy","service":"password-utility-api"}'
+
 
 @api_bp.route('/generate', methods=['POST'])
 @require_json
@@ -113,6 +118,7 @@ def generate_bulk():
 
 @api_bp.route('/analyze', methods=['POST'])
 @require_json
+@limit_concurrency(MAX_CONCURRENT_ANALYSES, ANALYSIS_SLOT_TIMEOUT)
 @handle_errors
 def analyze_password():
     """
@@ -150,7 +156,7 @@ def analyze_password():
             'score': analysis['score'],
             'entropy': round(analysis['entropy'], 2),
             'length': analysis['length'],
-            'diversity_score': round(analysis['diversity_score'], 2),
+            'diversity_score': analysis['diversity_score'],
             'has_uppercase': analysis['has_uppercase'],
             'has_lowercase': analysis['has_lowercase'],
             'has_numbers': analysis['has_numbers'],
@@ -159,9 +165,9 @@ def analyze_password():
             'security_level': analysis['security_level'],
             'detected_patterns': analysis['detected_patterns'],
             'recommendations': analysis['recommendations'],
-            'policy_valid': validation['valid'],
-            'policy_errors': validation['errors'],
-            'policy_warnings': validation['warnings']
+            'policy_valid': validation.valid,
+            'policy_errors': list(validation.errors),
+            'policy_warnings': list(validation.warnings)
         }
     })
 
@@ -208,8 +214,4 @@ def calculate_entropy():
 @api_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'success': True,
-        'status': 'healthy',
-        'service': 'password-utility-api'
-    })
+    return Response(_HEALTH, mimetype='application/json', direct_passthrough=True)
@@ -6,6 +6,17 @@ Validates and sanitizes user input.
 from typing import Dict, Tuple, Optional
 from config.web_settings import MAX_PASSWORD_LENGTH, MAX_BULK_GENERATION
 
+_OPTION_KEYS = ('uppercase', 'lowercase', 'numbers', 'symbols')
+_REQUIRED_OPTION_KEYS = frozenset(_OPTION_KEYS)
+
+# Error messages depend only on configuration, so format them once
+_LENGTH_RANGE_ERROR = f'Length must be between 4 and {MAX_PASSWORD_LENGTH}'
+_OPTION_KEYS_ERROR = f'Options must contain: {", ".join(_OPTION_KEYS)}'
+_COUNT_RANGE_ERROR = f'Count must be between 1 and {MAX_BULK_GENERATION}'
+_PASSWORD_LENGTH_ERROR = (
+    f'Password exceeds maximum length of {MAX_PASSWORD_LENGTH}'
+)
+
 
 class RequestValidator:
     """
@@ -34,7 +45,7 @@ class RequestValidator:
         try:
             length = int(data['length'])
             if length < 4 or length > MAX_PASSWORD_LENGTH:
-                return False, f'Length must be between 4 and {MAX_PASSWORD_LENGTH}'
+                return False, _LENGTH_RANGE_ERROR
         except (ValueError, TypeError):
             return False, 'Invalid length value'
         
@@ -43,9 +54,8 @@ class RequestValidator:
         if not isinstance(options, dict):
             return False, 'Options must be a dictionary'
         
-        required_keys = ['uppercase', 'lowercase', 'numbers', 'symbols']
-        if not all(key in options for key in required_keys):
-            return False, f'Options must contain: {", ".join(required_keys)}'
+        if not options.keys() >= _REQUIRED_OPTION_KEYS:
+            return False, _OPTION_KEYS_ERROR
         
         # Check at least one option is enabled
         if not any(options.values()):
@@ -76,7 +86,7 @@ class RequestValidator:
         try:
             count = int(data['count'])
             if count < 1 or count > MAX_BULK_GENERATION:
-                return False, f'Count must be between 1 and {MAX_BULK_GENERATION}'
+                return False, _COUNT_RANGE_ERROR
         except (ValueError, TypeError):
             return False, 'Invalid count value'
         
@@ -105,6 +115,6 @@ class RequestValidator:
         
         # Check length
         if len(password) > MAX_PASSWORD_LENGTH:
-            return False, f'Password exceeds maximum length of {MAX_PASSWORD_LENGTH}'
+            return False, _PASSWORD_LENGTH_ERROR
         
         return True, None
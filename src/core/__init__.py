@@ -2,9 +2,13 @@
 
 from .security import (
     secure_random_choice,
+    secure_random_choices,
     secure_shuffle,
-    secure_randint
+    secure_shuffle_inplace,
+    secure_randint,
+    secure_randints
 )
+from .digest_cache import DigestCache
 from .constants import (
     UPPERCASE,
     LOWERCASE,
@@ -22,8 +26,12 @@ from .exceptions import (
 
 __all__ = [
     'secure_random_choice',
+    'secure_random_choices',
     'secure_shuffle',
+    'secure_shuffle_inplace',
     'secure_randint',
+    'secure_randints',
+    'DigestCache',
     'UPPERCASE',
     'LOWERCASE',
     'DIGITS',
@@ -3,8 +3,9 @@ Security-focused constants and character sets.
 All values are immutable and cryptographically safe.
 """
 
+import re
 import string
-from typing import Final, List
+from typing import Final, Iterable, List, Pattern
 
 # Character Sets (immutable)
 UPPERCASE: Final[str] = string.ascii_uppercase
@@ -46,4 +47,33 @@ KEYBOARD_PATTERNS: Final[List[str]] = [
 REPEATED_CHAR_PATTERN: Final[str] = r'(.)\1{2,}'
 
 # Date patterns (regex)
-DATE_PATTERN: Final[str] = r'\d{2,4}[/-]\d{1,2}[/-]\d{1,2}'
\ No newline at end of file
+DATE_PATTERN: Final[str] = r'\d{2,4}[/-]\d{1,2}[/-]\d{1,2}'
+
+# Compiled forms of the regex patterns above, built once at import
+REPEATED_CHAR_RE: Final[Pattern[str]] = re.compile(REPEATED_CHAR_PATTERN)
+DATE_RE: Final[Pattern[str]] = re.compile(DATE_PATTERN)
+
+
+def _compile_literals(patterns: Iterable[str]) -> Pattern[str]:
+    """
+    Compile literal substrings into a single alternation regex.
+    
+    Longer substrings are tried first at each position.
+    
+    Args:
+        patterns: Literal substrings to match
+    
+    Returns:
+        Compiled pattern matching any of the substrings
+    """
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(pattern) for pattern in ordered))
+
+
+# One compiled matcher per pattern category, so each check is a single
+# C-level scan of the lowercased password; sequences also match reversed
+COMMON_PATTERN_RE: Final[Pattern[str]] = _compile_literals(COMMON_PATTERNS)
+SEQUENTIAL_PATTERN_RE: Final[Pattern[str]] = _compile_literals(
+    SEQUENTIAL_PATTERNS + [pattern[::-1] for pattern in SEQUENTIAL_PATTERNS]
+)
+KEYBOARD_PATTERN_RE: Final[Pattern[str]] = _compile_literals(KEYBOARD_PATTERNS)
@@ -0,0 +1,86 @@
+"""
+Bounded LRU cache for per-password results.
+Passwords are never stored: entries are keyed by a keyed BLAKE2b digest.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, TypeVar
+
+V = TypeVar('V')
+
+# Per-process secret key: cache digests are useless outside this process
+_DIGEST_KEY = os.urandom(16)
+
+
+class DigestCache(Generic[V]):
+    """
+    Thread-safe LRU cache mapping passwords to computed results.
+    
+    Security Guarantee:
+        - Passwords are not retained, only keyed 128-bit digests
+        - Digests cannot be matched against precomputed tables
+        - Cached values must not contain the password itself
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum cached entries (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: 'OrderedDict[bytes, V]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _digest(password: str) -> bytes:
+        """Keyed digest of a password (lone surrogates included)."""
+        return hashlib.blake2b(
+            password.encode('utf-8', 'surrogatepass'),
+            digest_size=16,
+            key=_DIGEST_KEY
+        ).digest()
+    
+    def get_or_compute(self, password: str,
+                       compute: Callable[[str], V]) -> V:
+        """
+        Get the cached result for a password, computing it on a miss.
+        
+        Args:
+            password: Password (not stored)
+            compute: Function producing the result from the password
+        
+        Returns:
+            Cached or freshly computed result (shared, do not mutate)
+        """
+        if self.max_size <= 0:
+            return compute(password)
+        
+        key = self._digest(password)
+        
+        with self._lock:
+            value: Optional[V] = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        
+        value = compute(password)
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        return value
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
@@ -2,14 +2,74 @@
 Core security functions using cryptographically secure randomness.
 All functions use the secrets module for CSPRNG operations.
 
-SECURITY GUARANTEE: No state is maintained between function calls.
+SECURITY GUARANTEE: No password-related state is maintained between calls.
+The only state is a per-thread buffer of not-yet-used OS entropy; consumed
+bytes are wiped immediately and the buffer is discarded after a fork.
 """
 
+import functools
+import os
 import secrets
-from typing import List, TypeVar
+import struct
+import threading
+from typing import List, Tuple, TypeVar
 
 T = TypeVar('T')
 
+# Bytes of OS entropy fetched per refill of a thread's pool
+_ENTROPY_POOL_SIZE = 4096
+
+
+class _EntropyPool(threading.local):
+    """Per-thread buffer of unused CSPRNG output."""
+    
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offset = 0
+
+
+_entropy_pool = _EntropyPool()
+
+
+def _reset_entropy_pool() -> None:
+    """Discard pooled bytes in a forked child so it never reuses the parent's."""
+    global _entropy_pool
+    _entropy_pool = _EntropyPool()
+
+
+if hasattr(os, 'register_at_fork'):  # absent where fork() is (Windows)
+    os.register_at_fork(after_in_child=_reset_entropy_pool)
+
+
+def _random_bytes(n: int) -> bytes:
+    """
+    Take n fresh random bytes from the calling thread's entropy pool.
+    
+    Args:
+        n: Number of bytes
+    
+    Returns:
+        Random bytes (never handed out twice)
+    
+    Security:
+        - Pool is filled from secrets.token_bytes
+        - Consumed bytes are zeroed in the pool
+        - A forked child discards the inherited pool
+    """
+    if n > _ENTROPY_POOL_SIZE:
+        return secrets.token_bytes(n)
+    
+    pool = _entropy_pool
+    if pool.offset + n > len(pool.buffer):
+        pool.buffer = bytearray(secrets.token_bytes(_ENTROPY_POOL_SIZE))
+        pool.offset = 0
+    
+    start = pool.offset
+    end = pool.offset = start + n
+    chunk = bytes(pool.buffer[start:end])
+    pool.buffer[start:end] = bytes(n)
+    return chunk
+
 
 def secure_random_choice(sequence: str) -> str:
     """
@@ -25,13 +85,82 @@ def secure_random_choice(sequence: str) -> str:
         ValueError: If sequence is empty
     
     Security:
-        - Uses secrets.choice (CSPRNG)
-        - No state maintained
-        - Uniform distribution
+        - Draws from the CSPRNG-filled entropy pool
+        - Rejection sampling keeps the distribution uniform
     """
     if not sequence:
         raise ValueError("Cannot choose from empty sequence")
-    return secrets.choice(sequence)
+    
+    n = len(sequence)
+    if n > 256:
+        return secrets.choice(sequence)
+    
+    # Bytes at or above the largest multiple of n would bias b % n
+    limit = 256 - 256 % n
+    while True:
+        b = _random_bytes(1)[0]
+        if b < limit:
+            return sequence[b % n]
+
+
+def secure_random_choices(sequence: str, k: int) -> List[str]:
+    """
+    Securely select k random characters from a sequence.
+    
+    Args:
+        sequence: Non-empty string of characters
+        k: Number of characters to select
+    
+    Returns:
+        List of k randomly selected characters
+    
+    Raises:
+        ValueError: If sequence is empty
+    
+    Security:
+        - One bulk draw from the entropy pool instead of one per character
+        - Rejection sampling keeps the distribution uniform
+        - Non-ASCII or larger sequences are indexed via secure_randints
+    """
+    if not sequence:
+        raise ValueError("Cannot choose from empty sequence")
+    
+    n = len(sequence)
+    if n > 256 or not sequence.isascii():
+        # No byte translation table possible; index via bulk integer lanes
+        return [sequence[i] for i in secure_randints(k, n)]
+    
+    table, rejected = _byte_choice_table(sequence)
+    accept_rate = (256 - len(rejected)) / 256
+    chosen = ''
+    
+    while len(chosen) < k:
+        needed = k - len(chosen)
+        raw = _random_bytes(int(needed / accept_rate) + 8)
+        # Drop biased bytes and map the rest onto sequence in one C call
+        chosen += raw.translate(table, rejected).decode('ascii')
+    
+    return list(chosen[:k])
+
+
+@functools.lru_cache(maxsize=32)
+def _byte_choice_table(sequence: str) -> Tuple[bytes, bytes]:
+    """
+    Build bytes.translate arguments mapping random bytes onto sequence.
+    
+    Args:
+        sequence: ASCII string of at most 256 characters
+    
+    Returns:
+        (translation table, bytes to delete)
+    
+    Note: Bytes at or above the largest multiple of len(sequence) are
+    deleted, since keeping them would bias b % len(sequence).
+    """
+    n = len(sequence)
+    limit = 256 - 256 % n
+    table = bytes(ord(sequence[b % n]) if b < limit else 0 for b in range(256))
+    return table, bytes(range(limit, 256))
 
 
 def secure_randint(min_val: int, max_val: int) -> int:
@@ -56,9 +185,54 @@ def secure_randint(min_val: int, max_val: int) -> int:
     return min_val + secrets.randbelow(range_size)
 
 
+# (lane span, struct code, width in bytes), narrowest first
+_INT_LANES = ((1 << 8, 'B', 1), (1 << 16, 'H', 2), (1 << 32, 'I', 4), (1 << 64, 'Q', 8))
+
+
+def secure_randints(n: int, bound: int) -> List[int]:
+    """
+    Generate n cryptographically secure random integers in [0, bound).
+    
+    Args:
+        n: Number of integers to generate
+        bound: Exclusive upper bound (must be positive)
+    
+    Returns:
+        List of n random integers
+    
+    Raises:
+        ValueError: If bound is not positive
+    
+    Security:
+        - Bulk draws from the entropy pool, unpacked in fixed-width lanes
+        - Lanes at or above the largest multiple of bound are rejected
+        - Uniform distribution guaranteed
+    """
+    if bound <= 0:
+        raise ValueError("bound must be positive")
+    
+    for span, code, width in _INT_LANES:
+        if bound <= span:
+            break
+    else:
+        return [secrets.randbelow(bound) for _ in range(n)]
+    
+    limit = span - span % bound
+    accept_rate = limit / span
+    result: List[int] = []
+    
+    while len(result) < n:
+        count = int((n - len(result)) / accept_rate) + 4
+        lanes = struct.unpack(f'<{count}{code}', _random_bytes(count * width))
+        result.extend(v % bound for v in lanes if v < limit)
+    
+    del result[n:]
+    return result
+
+
 def secure_shuffle(items: List[T]) -> List[T]:
     """
-    Securely shuffle a list using Fisher-Yates algorithm with CSPRNG.
+    Securely shuffle a list by sorting on random 64-bit keys.
     
     Args:
         items: List to shuffle
@@ -67,19 +241,48 @@ def secure_shuffle(items: List[T]) -> List[T]:
         New shuffled list (original unchanged)
     
     Security:
-        - Fisher-Yates algorithm with secrets.randbelow
-        - Uniform permutation distribution
+        - All keys come from one entropy pool draw
+        - Keys are redrawn on any tie, so every permutation is equally likely
         - Original list not modified
-        - No state maintained
     """
-    shuffled = items.copy()
-    n = len(shuffled)
+    if len(items) < 2:
+        return items.copy()
+    return [items[i] for i in _random_order(len(items))]
+
+
+def secure_shuffle_inplace(items: List[T]) -> None:
+    """
+    Securely shuffle a list in place, for callers that own the list.
     
-    for i in range(n - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+    Args:
+        items: List to shuffle (modified)
     
-    return shuffled
+    Security:
+        - Same permutation source as secure_shuffle
+        - Every permutation is equally likely
+    """
+    if len(items) >= 2:
+        items[:] = [items[i] for i in _random_order(len(items))]
+
+
+def _random_order(n: int) -> List[int]:
+    """
+    Draw a uniformly random permutation of range(n).
+    
+    Args:
+        n: Permutation size
+    
+    Returns:
+        Indices 0..n-1 in random order
+    
+    Note: Indices are sorted on 64-bit keys from one entropy pool draw;
+    keys are redrawn on any tie, so every permutation is equally likely.
+    """
+    while True:
+        keys = struct.unpack(f'<{n}Q', _random_bytes(8 * n))
+        if len(set(keys)) == n:
+            break
+    return sorted(range(n), key=keys.__getitem__)
 
 
 def generate_secure_token(length: int = 32) -> str:
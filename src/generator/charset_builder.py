@@ -3,9 +3,35 @@ Character set builder for password generation.
 Constructs character sets based on user options.
 """
 
-from typing import Dict, Set
+from typing import Dict, Tuple
 from ..core.constants import UPPERCASE, LOWERCASE, DIGITS, SYMBOLS
 
+# (option name, bit, character set) in charset concatenation order
+_CHARSET_PARTS = (
+    ('uppercase', 8, UPPERCASE),
+    ('lowercase', 4, LOWERCASE),
+    ('numbers', 2, DIGITS),
+    ('symbols', 1, SYMBOLS),
+)
+
+
+def _options_key(options: Dict[str, bool]) -> int:
+    """Pack the four character set options into a 4-bit key."""
+    key = 0
+    for name, bit, _ in _CHARSET_PARTS:
+        if options.get(name, False):
+            key |= bit
+    return key
+
+
+# Charset and required character sets for every 4-bit options key,
+# precomputed at import so lookups never build strings
+_REQUIRED: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(part for _, bit, part in _CHARSET_PARTS if key & bit)
+    for key in range(16)
+)
+_CHARSETS: Tuple[str, ...] = tuple(''.join(parts) for parts in _REQUIRED)
+
 
 class CharsetBuilder:
     """
@@ -27,16 +53,7 @@ class CharsetBuilder:
         Raises:
             ValueError: If no character sets selected
         """
-        charset = ''
-        
-        if options.get('uppercase', False):
-            charset += UPPERCASE
-        if options.get('lowercase', False):
-            charset += LOWERCASE
-        if options.get('numbers', False):
-            charset += DIGITS
-        if options.get('symbols', False):
-            charset += SYMBOLS
+        charset = _CHARSETS[_options_key(options)]
         
         if not charset:
             raise ValueError("At least one character set must be selected")
@@ -54,18 +71,7 @@ class CharsetBuilder:
         Returns:
             List of character sets that must be represented
         """
-        required = []
-        
-        if options.get('uppercase', False):
-            required.append(UPPERCASE)
-        if options.get('lowercase', False):
-            required.append(LOWERCASE)
-        if options.get('numbers', False):
-            required.append(DIGITS)
-        if options.get('symbols', False):
-            required.append(SYMBOLS)
-        
-        return required
+        return list(_REQUIRED[_options_key(options)])
     
     @staticmethod
     def calculate_charset_size(options: Dict[str, bool]) -> int:
@@ -78,18 +84,7 @@ class CharsetBuilder:
         Returns:
             Total number of unique characters
         """
-        size = 0
-        
-        if options.get('uppercase', False):
-            size += len(UPPERCASE)
-        if options.get('lowercase', False):
-            size += len(LOWERCASE)
-        if options.get('numbers', False):
-            size += len(DIGITS)
-        if options.get('symbols', False):
-            size += len(SYMBOLS)
-        
-        return size
+        return len(_CHARSETS[_options_key(options)])
     
     @staticmethod
     def validate_options(options: Dict[str, bool]) -> bool:
@@ -3,9 +3,30 @@ Entropy calculator for password strength measurement.
 Calculates Shannon entropy and provides security metrics.
 """
 
+import bisect
+import functools
 import math
 from typing import Dict
 
+# Rating band lower bounds (bits) and names; entropy >= bound moves up a band
+_RATING_BANDS = (40, 60, 80)
+_RATING_NAMES = ("Poor", "Fair", "Good", "Excellent")
+
+
+@functools.lru_cache(maxsize=1024)
+def _entropy_bits(length: int, charset_size: int) -> float:
+    """Cached length * log2(charset_size); the input domain is tiny."""
+    if charset_size <= 0 or length <= 0:
+        return 0.0
+    
+    return length * math.log2(charset_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _entropy_rating(entropy: float) -> str:
+    """Cached rating for an entropy value."""
+    return _RATING_NAMES[bisect.bisect_right(_RATING_BANDS, entropy)]
+
 
 class EntropyCalculator:
     """
@@ -27,10 +48,7 @@ class EntropyCalculator:
         Returns:
             Entropy in bits
         """
-        if charset_size <= 0 or length <= 0:
-            return 0.0
-        
-        return length * math.log2(charset_size)
+        return _entropy_bits(length, charset_size)
     
     @staticmethod
     def calculate_combinations(length: int, charset_size: int) -> float:
@@ -85,11 +103,4 @@ class EntropyCalculator:
         Returns:
             Rating string
         """
-        if entropy >= 80:
-            return "Excellent"
-        elif entropy >= 60:
-            return "Good"
-        elif entropy >= 40:
-            return "Fair"
-        else:
-            return "Poor"
\ No newline at end of file
+        return _entropy_rating(entropy)
\ No newline at end of file
@@ -3,8 +3,11 @@ Secure password generator using cryptographically secure randomness.
 Implements stateless password generation with guaranteed character diversity.
 """
 
-from typing import Dict
-from ..core.security import secure_random_choice, secure_shuffle
+from typing import Dict, List, Tuple
+from ..core.security import (
+    secure_random_choices,
+    secure_shuffle_inplace
+)
 from ..core.exceptions import InvalidLengthError, InvalidCharsetError
 from .charset_builder import CharsetBuilder
 from .entropy_calculator import EntropyCalculator
@@ -52,6 +55,74 @@ class PasswordGenerator:
             - Guaranteed character diversity
             - Secure shuffle prevents patterns
         """
+        # Return password (no storage)
+        return self._generate_batch(1, length, options)[0]
+    
+    def generate_multiple(self, count: int, length: int, 
+                         options: Dict[str, bool]) -> list:
+        """
+        Generate multiple passwords.
+        
+        Args:
+            count: Number of passwords to generate
+            length: Password length
+            options: Character set options
+        
+        Returns:
+            List of passwords
+        
+        Note: Each password is generated independently with no correlation.
+        """
+        return self._generate_batch(count, length, options)
+    
+    def _generate_batch(self, count: int, length: int,
+                        options: Dict[str, bool]) -> List[str]:
+        """
+        Generate count passwords from batched CSPRNG draws.
+        
+        Args:
+            count: Number of passwords to generate
+            length: Password length
+            options: Character set options
+        
+        Returns:
+            List of passwords
+        
+        Note: One bulk draw per required set covers that set's pick for
+        every password, and one more covers all filler characters.
+        """
+        charset, required_charsets = self._prepare(length, options)
+        remaining = length - len(required_charsets)
+        required_picks = [
+            secure_random_choices(char_set, count)
+            for char_set in required_charsets
+        ]
+        fill_chars = secure_random_choices(charset, count * remaining)
+        
+        return [
+            self._assemble(
+                [picks[i] for picks in required_picks],
+                fill_chars[i * remaining:(i + 1) * remaining]
+            )
+            for i in range(count)
+        ]
+    
+    def _prepare(self, length: int,
+                 options: Dict[str, bool]) -> Tuple[str, list]:
+        """
+        Validate generation parameters and build character sets.
+        
+        Args:
+            length: Password length
+            options: Character set options
+        
+        Returns:
+            (charset, required_charsets)
+        
+        Raises:
+            InvalidLengthError: If length is invalid
+            InvalidCharsetError: If no character sets selected
+        """
         # Validate length
         if length < MIN_PASSWORD_LENGTH or length > MAX_PASSWORD_LENGTH:
             raise InvalidLengthError(length, MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH)
@@ -71,40 +142,25 @@ class PasswordGenerator:
                 MAX_PASSWORD_LENGTH
             )
         
-        # Generate password with guaranteed diversity
-        password_chars = []
-        
-        # Add one character from each required set
-        for char_set in required_charsets:
-            password_chars.append(secure_random_choice(char_set))
-        
-        # Fill remaining positions with random characters
-        remaining = length - len(password_chars)
-        for _ in range(remaining):
-            password_chars.append(secure_random_choice(charset))
-        
-        # Securely shuffle to eliminate position patterns
-        password_chars = secure_shuffle(password_chars)
-        
-        # Return password (no storage)
-        return ''.join(password_chars)
+        return charset, required_charsets
     
-    def generate_multiple(self, count: int, length: int, 
-                         options: Dict[str, bool]) -> list:
+    def _assemble(self, required_chars: List[str],
+                  fill_chars: List[str]) -> str:
         """
-        Generate multiple passwords.
+        Build one password with guaranteed diversity.
         
         Args:
-            count: Number of passwords to generate
-            length: Password length
-            options: Character set options
+            required_chars: One random character from each required set
+            fill_chars: Random characters for the remaining positions
         
         Returns:
-            List of passwords
-        
-        Note: Each password is generated independently with no correlation.
+            Shuffled password string
         """
-        return [self.generate(length, options) for _ in range(count)]
+        password_chars = required_chars + fill_chars
+        
+        # Securely shuffle to eliminate position patterns; the list is ours
+        secure_shuffle_inplace(password_chars)
+        return ''.join(password_chars)
     
     def calculate_entropy(self, length: int, options: Dict[str, bool]) -> float:
         """
@@ -5,8 +5,23 @@ Password analyzer panel UI component.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from ..analyzer import PasswordAnalyzer
-from ..validator import PolicyValidator, PasswordPolicy
-from .styles import COLORS, FONTS, PADDING, get_strength_color
+from ..validator import PolicyValidator, PasswordPolicy, ValidationResult
+from .styles import (
+    FONTS, PADDING, get_strength_color, strength_key,
+    COLOR_SUCCESS, COLOR_WARNING, COLOR_WEAK, COLOR_MEDIUM, COLOR_STRONG,
+    COLOR_VERY_STRONG
+)
+
+# Results text tags, resolved against the theme once at import
+TAG_SPECS = (
+    ('weak', {'foreground': COLOR_WEAK}),
+    ('medium', {'foreground': COLOR_MEDIUM}),
+    ('strong', {'foreground': COLOR_STRONG}),
+    ('very_strong', {'foreground': COLOR_VERY_STRONG}),
+    ('heading', {'font': FONTS['heading']}),
+    ('success', {'foreground': COLOR_SUCCESS}),
+    ('warning', {'foreground': COLOR_WARNING}),
+)
 
 
 class AnalyzerPanel:
@@ -23,14 +38,48 @@ class AnalyzerPanel:
             parent: Parent widget
         """
         self.parent = parent
-        self.analyzer = PasswordAnalyzer()
-        self.policy = PasswordPolicy()
-        self.validator = PolicyValidator(self.policy)
+        
+        # Analysis components are built on first use (see properties below)
+        self._analyzer = None
+        self._policy = None
+        self._validator = None
+        
+        # Last rendered results, to skip redrawing identical output
+        self._last_results = None
         
         # UI variables
         self.show_password_var = tk.BooleanVar(value=False)
         
         self._create_widgets()
+        
+        # Warm the components once the window is idle, off the startup path
+        self.parent.after_idle(self._warm_up)
+    
+    @property
+    def analyzer(self) -> PasswordAnalyzer:
+        """Password analyzer, created on first access."""
+        if self._analyzer is None:
+            self._analyzer = PasswordAnalyzer()
+        return self._analyzer
+    
+    @property
+    def policy(self) -> PasswordPolicy:
+        """Password policy, created on first access."""
+        if self._policy is None:
+            self._policy = PasswordPolicy()
+        return self._policy
+    
+    @property
+    def validator(self) -> PolicyValidator:
+        """Policy validator, created on first access."""
+        if self._validator is None:
+            self._validator = PolicyValidator(self.policy, self.analyzer)
+        return self._validator
+    
+    def _warm_up(self):
+        """Create analysis components ahead of the first Analyze click."""
+        _ = self.analyzer
+        _ = self.validator
     
     def _create_widgets(self):
         """Create all analyzer panel widgets."""
@@ -52,29 +101,31 @@ class AnalyzerPanel:
         input_frame = ttk.Frame(self.frame)
         input_frame.pack(fill=tk.X, pady=PADDING['widget'])
         
+        # Grid keeps the entry and Clear button on one row without a wrapper
+        input_frame.columnconfigure(0, weight=1)
+        
         ttk.Label(input_frame, text='Enter password to analyze:',
-                 font=FONTS['normal']).pack(anchor=tk.W)
+                 font=FONTS['normal']).grid(row=0, column=0, columnspan=2,
+                                            sticky=tk.W)
         
         # Password entry
-        entry_container = ttk.Frame(input_frame)
-        entry_container.pack(fill=tk.X, pady=(5, 0))
-        
-        self.password_entry = ttk.Entry(entry_container,
+        self.password_entry = ttk.Entry(input_frame,
                                        font=FONTS['mono'],
                                        show='●')
-        self.password_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.password_entry.grid(row=1, column=0, sticky=tk.EW, pady=(5, 0))
         
         # Clear button
-        clear_btn = ttk.Button(entry_container, text='Clear',
+        clear_btn = ttk.Button(input_frame, text='Clear',
                               command=self._clear_input,
                               width=8)
-        clear_btn.pack(side=tk.LEFT, padx=(5, 0))
+        clear_btn.grid(row=1, column=1, padx=(5, 0), pady=(5, 0))
         
         # Show/hide toggle
         show_check = ttk.Checkbutton(input_frame, text='Show password',
                                     variable=self.show_password_var,
                                     command=self._toggle_visibility)
-        show_check.pack(anchor=tk.W, pady=(5, 0))
+        show_check.grid(row=2, column=0, columnspan=2, sticky=tk.W,
+                        pady=(5, 0))
     
     def _create_action_button(self):
         """Create analyze button."""
@@ -93,13 +144,10 @@ class AnalyzerPanel:
         results_frame.pack(fill=tk.BOTH, expand=True, pady=PADDING['widget'])
         
         # Text widget with scrollbar
-        text_container = ttk.Frame(results_frame)
-        text_container.pack(fill=tk.BOTH, expand=True)
-        
-        scrollbar = ttk.Scrollbar(text_container)
+        scrollbar = ttk.Scrollbar(results_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.results_text = tk.Text(text_container,
+        self.results_text = tk.Text(results_frame,
                                    height=15,
                                    width=60,
                                    font=FONTS['mono'],
@@ -115,13 +163,8 @@ class AnalyzerPanel:
     
     def _configure_text_tags(self):
         """Configure text widget color tags."""
-        self.results_text.tag_configure('weak', foreground=COLORS['weak'])
-        self.results_text.tag_configure('medium', foreground=COLORS['medium'])
-        self.results_text.tag_configure('strong', foreground=COLORS['strong'])
-        self.results_text.tag_configure('very_strong', foreground=COLORS['very_strong'])
-        self.results_text.tag_configure('heading', font=FONTS['heading'])
-        self.results_text.tag_configure('success', foreground=COLORS['success'])
-        self.results_text.tag_configure('warning', foreground=COLORS['warning'])
+        for name, options in TAG_SPECS:
+            self.results_text.tag_configure(name, **options)
     
     def _toggle_visibility(self):
         """Toggle password visibility."""
@@ -137,6 +180,7 @@ class AnalyzerPanel:
     
     def _clear_results(self):
         """Clear results display."""
+        self._last_results = None
         self.results_text.configure(state='normal')
         self.results_text.delete(1.0, tk.END)
         self.results_text.configure(state='disabled')
@@ -161,77 +205,87 @@ class AnalyzerPanel:
         except Exception as e:
             messagebox.showerror('Error', f'Analysis failed: {str(e)}')
     
-    def _display_results(self, analysis: dict, validation: dict):
+    def _display_results(self, analysis: dict,
+                         validation: ValidationResult):
         """
         Display analysis results.
         
+        The report is built as (text, tags) segments and written with a
+        single Text.insert call, so Tk lays the text out once. Results
+        identical to those already shown are not redrawn.
+        
         Args:
             analysis: Analysis results dict
-            validation: Validation results dict
+            validation: Policy validation result
         """
-        self.results_text.configure(state='normal')
-        self.results_text.delete(1.0, tk.END)
+        if self._last_results == (analysis, validation):
+            return
+        self._last_results = (analysis, validation)
+        
+        a = analysis
+        v = validation
+        segments = []
+        add = segments.extend
         
         # Strength header
-        strength = analysis['strength']
-        tag = strength.lower().replace(' ', '_')
-        self.results_text.insert(tk.END, f"STRENGTH: {strength.upper()}\n", 
-                                ['heading', tag])
-        self.results_text.insert(tk.END, f"Score: {analysis['score']}/100\n\n")
+        strength = a['strength']
+        tag = strength_key(strength)
+        add((f"STRENGTH: {strength.upper()}\n", ('heading', tag),
+             f"Score: {a['score']}/100\n\n", ()))
         
         # Metrics
-        self.results_text.insert(tk.END, "METRICS\n", 'heading')
-        self.results_text.insert(tk.END, f"Length: {analysis['length']} characters\n")
-        self.results_text.insert(tk.END, f"Entropy: {analysis['entropy']:.1f} bits\n")
-        self.results_text.insert(tk.END, f"Diversity: {analysis['diversity_score']:.0%}\n")
-        self.results_text.insert(tk.END, f"Crack Time: {analysis['crack_time']}\n")
-        self.results_text.insert(tk.END, f"Security: {analysis['security_level']}\n\n")
+        add(("METRICS\n", 'heading',
+             f"Length: {a['length']} characters\n"
+             f"Entropy: {a['entropy']:.1f} bits\n"
+             f"Diversity: {a['diversity_score']:.0%}\n"
+             f"Crack Time: {a['crack_time']}\n"
+             f"Security: {a['security_level']}\n\n", ()))
         
         # Character types
-        self.results_text.insert(tk.END, "CHARACTER TYPES\n", 'heading')
-        self._insert_check('Uppercase', analysis['has_uppercase'])
-        self._insert_check('Lowercase', analysis['has_lowercase'])
-        self._insert_check('Numbers', analysis['has_numbers'])
-        self._insert_check('Symbols', analysis['has_symbols'])
-        self.results_text.insert(tk.END, "\n")
+        add(("CHARACTER TYPES\n", 'heading'))
+        add(self._check_segments('Uppercase', a['has_uppercase']))
+        add(self._check_segments('Lowercase', a['has_lowercase']))
+        add(self._check_segments('Numbers', a['has_numbers']))
+        add(self._check_segments('Symbols', a['has_symbols']))
+        add(("\n", ()))
         
         # Detected patterns
-        if analysis['detected_patterns']:
-            self.results_text.insert(tk.END, "DETECTED ISSUES\n", 'heading')
-            for pattern in analysis['detected_patterns']:
-                self.results_text.insert(tk.END, f"  ⚠  {pattern}\n", 'warning')
-            self.results_text.insert(tk.END, "\n")
+        if a['detected_patterns']:
+            add(("DETECTED ISSUES\n", 'heading',
+                 ''.join(f"  ⚠  {pattern}\n" for pattern in a['detected_patterns']),
+                 'warning',
+                 "\n", ()))
         
         # Policy validation
-        self.results_text.insert(tk.END, "POLICY VALIDATION\n", 'heading')
-        if validation['valid']:
-            self.results_text.insert(tk.END, "  ✓  Meets policy requirements\n", 
-                                   'success')
+        add(("POLICY VALIDATION\n", 'heading'))
+        if v.valid:
+            add(("  ✓  Meets policy requirements\n", 'success'))
         else:
-            for error in validation['errors']:
-                self.results_text.insert(tk.END, f"  ✗  {error}\n", 'weak')
+            add((''.join(f"  ✗  {error}\n" for error in v.errors), 'weak'))
         
-        if validation['warnings']:
-            self.results_text.insert(tk.END, "\nWarnings:\n")
-            for warning in validation['warnings']:
-                self.results_text.insert(tk.END, f"  •  {warning}\n", 'warning')
+        if v.warnings:
+            add(("\nWarnings:\n", (),
+                 ''.join(f"  •  {warning}\n" for warning in v.warnings),
+                 'warning'))
         
-        self.results_text.insert(tk.END, "\n")
+        add(("\n", ()))
         
         # Recommendations
-        if analysis['recommendations']:
-            self.results_text.insert(tk.END, "RECOMMENDATIONS\n", 'heading')
-            for rec in analysis['recommendations']:
-                self.results_text.insert(tk.END, f"  •  {rec}\n")
+        if a['recommendations']:
+            add(("RECOMMENDATIONS\n", 'heading',
+                 ''.join(f"  •  {rec}\n" for rec in a['recommendations']), ()))
         
+        self.results_text.configure(state='normal')
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, *segments)
         self.results_text.configure(state='disabled')
     
-    def _insert_check(self, label: str, value: bool):
-        """Insert checkmark line."""
+    @staticmethod
+    def _check_segments(label: str, value: bool) -> tuple:
+        """Build (text, tags) segments for a checkmark line."""
         symbol = '✓' if value else '✗'
         tag = 'success' if value else 'weak'
-        self.results_text.insert(tk.END, f"  {symbol}  {label}: ", tag)
-        self.results_text.insert(tk.END, f"{value}\n")
+        return (f"  {symbol}  {label}: ", tag, f"{value}\n", ())
     
     def pack(self, **kwargs):
         """Pack the panel frame."""
@@ -3,9 +3,11 @@ Password generator panel UI component.
 """
 
 import tkinter as tk
+from typing import Dict, Tuple
 from tkinter import ttk, messagebox
 from ..generator import PasswordGenerator
-from .styles import COLORS, FONTS, PADDING, configure_ttk_styles
+from .styles import COLOR_PRIMARY, FONTS, PADDING, configure_ttk_styles
+from config.settings import UI_ENTROPY_DEBOUNCE_MS
 
 
 class GeneratorPanel:
@@ -31,7 +33,22 @@ class GeneratorPanel:
         self.lowercase_var = tk.BooleanVar(value=True)
         self.numbers_var = tk.BooleanVar(value=True)
         self.symbols_var = tk.BooleanVar(value=True)
-        self.entropy_var = tk.StringVar(value='Entropy: 0.0 bits')
+        
+        # Plain mirror of the checkbox vars, kept in sync by their commands
+        self._opts_cache = {
+            name: var.get() for name, var in (
+                ('uppercase', self.uppercase_var),
+                ('lowercase', self.lowercase_var),
+                ('numbers', self.numbers_var),
+                ('symbols', self.symbols_var)
+            )
+        }
+        
+        # Pending debounced entropy refresh (after() id)
+        self._entropy_after_id = None
+        
+        # Entropy label text by (length, option flags); the space is tiny
+        self._entropy_cache: Dict[Tuple[int, Tuple[bool, ...]], str] = {}
         
         self._create_widgets()
     
@@ -64,9 +81,11 @@ class GeneratorPanel:
         ttk.Label(length_frame, text='Length:', 
                  font=FONTS['normal']).pack(side=tk.LEFT, padx=(0, 10))
         
-        length_value = ttk.Label(length_frame, textvariable=self.length_var,
-                                font=FONTS['normal'], width=3)
-        length_value.pack(side=tk.LEFT)
+        # Updated directly in _on_length_change rather than via textvariable
+        self.length_label = ttk.Label(length_frame,
+                                      text=str(self.length_var.get()),
+                                      font=FONTS['normal'], width=3)
+        self.length_label.pack(side=tk.LEFT)
         
         length_slider = ttk.Scale(length_frame, from_=4, to=64,
                                  variable=self.length_var,
@@ -83,25 +102,27 @@ class GeneratorPanel:
         # Create 2x2 grid of checkboxes
         ttk.Checkbutton(options_frame, text='Uppercase (A-Z)',
                        variable=self.uppercase_var,
-                       command=self._update_entropy).grid(row=0, column=0, 
-                                                          sticky=tk.W, pady=2)
+                       command=lambda: self._on_charset_change(
+                           'uppercase', self.uppercase_var)
+                       ).grid(row=0, column=0, sticky=tk.W, pady=2)
         
         ttk.Checkbutton(options_frame, text='Lowercase (a-z)',
                        variable=self.lowercase_var,
-                       command=self._update_entropy).grid(row=1, column=0,
-                                                          sticky=tk.W, pady=2)
+                       command=lambda: self._on_charset_change(
+                           'lowercase', self.lowercase_var)
+                       ).grid(row=1, column=0, sticky=tk.W, pady=2)
         
         ttk.Checkbutton(options_frame, text='Numbers (0-9)',
                        variable=self.numbers_var,
-                       command=self._update_entropy).grid(row=0, column=1,
-                                                          sticky=tk.W, 
-                                                          padx=20, pady=2)
+                       command=lambda: self._on_charset_change(
+                           'numbers', self.numbers_var)
+                       ).grid(row=0, column=1, sticky=tk.W, padx=20, pady=2)
         
         ttk.Checkbutton(options_frame, text='Symbols (!@#$...)',
                        variable=self.symbols_var,
-                       command=self._update_entropy).grid(row=1, column=1,
-                                                          sticky=tk.W,
-                                                          padx=20, pady=2)
+                       command=lambda: self._on_charset_change(
+                           'symbols', self.symbols_var)
+                       ).grid(row=1, column=1, sticky=tk.W, padx=20, pady=2)
     
     def _create_password_display(self):
         """Create password display field."""
@@ -131,38 +152,57 @@ class GeneratorPanel:
     
     def _create_entropy_display(self):
         """Create entropy information display."""
-        entropy_label = ttk.Label(self.frame, textvariable=self.entropy_var,
-                                 font=FONTS['normal'],
-                                 foreground=COLORS['primary'])
-        entropy_label.pack(pady=(5, 0))
+        self.entropy_label = ttk.Label(self.frame, text='Entropy: 0.0 bits',
+                                      font=FONTS['normal'],
+                                      foreground=COLOR_PRIMARY)
+        self.entropy_label.pack(pady=(5, 0))
     
     def _get_options(self) -> dict:
         """Get current character set options."""
-        return {
-            'uppercase': self.uppercase_var.get(),
-            'lowercase': self.lowercase_var.get(),
-            'numbers': self.numbers_var.get(),
-            'symbols': self.symbols_var.get()
-        }
+        return dict(self._opts_cache)
+    
+    def _on_charset_change(self, name: str, var: tk.BooleanVar):
+        """Handle character set checkbox toggle."""
+        self._opts_cache[name] = var.get()
+        self._schedule_entropy_update()
     
     def _on_length_change(self, value):
         """Handle length slider change."""
-        self.length_var.set(int(float(value)))
-        self._update_entropy()
+        length = int(float(value))
+        self.length_var.set(length)
+        self.length_label.configure(text=str(length))
+        self._schedule_entropy_update()
+    
+    def _schedule_entropy_update(self):
+        """Refresh entropy once input has been quiet for the debounce period."""
+        if self._entropy_after_id is not None:
+            self.parent.after_cancel(self._entropy_after_id)
+        self._entropy_after_id = self.parent.after(UI_ENTROPY_DEBOUNCE_MS,
+                                                   self._update_entropy)
     
     def _update_entropy(self):
         """Update entropy display."""
+        # Direct calls supersede any pending debounced refresh
+        if self._entropy_after_id is not None:
+            self.parent.after_cancel(self._entropy_after_id)
+            self._entropy_after_id = None
+        
         try:
             options = self._get_options()
             if any(options.values()):
                 length = self.length_var.get()
-                entropy = self.generator.calculate_entropy(length, options)
-                rating = self.generator.entropy_calc.get_entropy_rating(entropy)
-                self.entropy_var.set(f'Entropy: {entropy:.1f} bits ({rating})')
+                key = (length, tuple(options.values()))
+                text = self._entropy_cache.get(key)
+                if text is None:
+                    entropy = self.generator.calculate_entropy(length, options)
+                    rating = self.generator.entropy_calc.get_entropy_rating(entropy)
+                    text = f'Entropy: {entropy:.1f} bits ({rating})'
+                    self._entropy_cache[key] = text
+                self.entropy_label.configure(text=text)
             else:
-                self.entropy_var.set('Entropy: 0.0 bits (Select character sets)')
+                self.entropy_label.configure(text='Entropy: 0.0 bits (Select character sets)')
         except Exception:
-            self.entropy_var.set('Entropy: 0.0 bits')
+            self.entropy_label.configure(text='Entropy: 0.0 bits')
     
     def _generate_password(self):
         """Generate new password."""
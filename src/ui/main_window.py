@@ -31,14 +31,12 @@ class PasswordUtilityApp:
     def _configure_window(self):
         """Configure main window properties."""
         self.root.title('Secure Password Utility')
-        self.root.geometry(f'{UI_WINDOW_WIDTH}x{UI_WINDOW_HEIGHT}')
         self.root.resizable(False, False)
         
-        # Center window on screen
-        self.root.update_idletasks()
+        # Center window on screen; screen size needs no idle-task flush
         x = (self.root.winfo_screenwidth() // 2) - (UI_WINDOW_WIDTH // 2)
         y = (self.root.winfo_screenheight() // 2) - (UI_WINDOW_HEIGHT // 2)
-        self.root.geometry(f'+{x}+{y}')
+        self.root.geometry(f'{UI_WINDOW_WIDTH}x{UI_WINDOW_HEIGHT}+{x}+{y}')
     
     def _setup_styles(self):
         """Setup ttk styles."""
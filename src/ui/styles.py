@@ -2,10 +2,11 @@
 UI styling and theme configuration.
 """
 
+from types import MappingProxyType
 from typing import Dict
 
-# Color scheme
-COLORS = {
+# Color scheme (read-only)
+COLORS = MappingProxyType({
     'primary': '#2196F3',
     'success': '#4CAF50',
     'warning': '#FF9800',
@@ -18,26 +19,58 @@ COLORS = {
     'text': '#212121',
     'secondary_text': '#757575',
     'border': '#BDBDBD'
-}
+})
 
-# Font configurations
-FONTS = {
+# Font configurations (read-only)
+FONTS = MappingProxyType({
     'title': ('Arial', 20, 'bold'),
     'heading': ('Arial', 14, 'bold'),
     'normal': ('Arial', 10),
     'mono': ('Courier', 12),
     'small': ('Arial', 9, 'italic')
-}
+})
 
-# Widget padding
-PADDING = {
+# Widget padding (read-only)
+PADDING = MappingProxyType({
     'main': 20,
     'section': 15,
     'widget': 10,
     'small': 5
+})
+
+# Frequently used colors, bound once
+COLOR_PRIMARY = COLORS['primary']
+COLOR_SUCCESS = COLORS['success']
+COLOR_WARNING = COLORS['warning']
+COLOR_WEAK = COLORS['weak']
+COLOR_MEDIUM = COLORS['medium']
+COLOR_STRONG = COLORS['strong']
+COLOR_VERY_STRONG = COLORS['very_strong']
+
+# Strength label -> COLORS/text-tag key, for the labels the scorer produces
+_STRENGTH_KEY_CACHE = {
+    strength: strength.lower().replace(' ', '_')
+    for strength in ('Weak', 'Medium', 'Strong', 'Very Strong',
+                     'weak', 'medium', 'strong', 'very strong')
 }
 
 
+def strength_key(strength: str) -> str:
+    """
+    Get COLORS/text-tag key for a strength level.
+    
+    Args:
+        strength: Strength level string
+    
+    Returns:
+        Lowercase, underscore-separated key
+    """
+    key = _STRENGTH_KEY_CACHE.get(strength)
+    if key is None:
+        key = strength.lower().replace(' ', '_')
+    return key
+
+
 def get_strength_color(strength: str) -> str:
     """
     Get color for strength level.
@@ -48,8 +81,7 @@ def get_strength_color(strength: str) -> str:
     Returns:
         Color code
     """
-    strength_lower = strength.lower().replace(' ', '_')
-    return COLORS.get(strength_lower, COLORS['text'])
+    return COLORS.get(strength_key(strength), COLORS['text'])
 
 
 def configure_ttk_styles(style):
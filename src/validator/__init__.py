@@ -1,6 +1,6 @@
 """Password policy validation modules."""
 
-from .policy_validator import PolicyValidator
+from .policy_validator import PolicyValidator, ValidationResult
 from .policy_rules import PasswordPolicy, PolicyRule
 
-__all__ = ['PolicyValidator', 'PasswordPolicy', 'PolicyRule']
+__all__ = ['PolicyValidator', 'ValidationResult', 'PasswordPolicy', 'PolicyRule']
@@ -3,8 +3,10 @@ Password policy rules and configuration.
 Defines customizable security policies for web applications.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import asdict, dataclass, fields
+from functools import cached_property
+from typing import Iterator, Optional, Tuple
 from config.settings import (
     DEFAULT_POLICY_MIN_LENGTH,
     DEFAULT_POLICY_MAX_LENGTH,
@@ -15,60 +17,96 @@ from config.settings import (
 )
 
 
-@dataclass
+# Rule error messages, interned so rules and validation results share them
+UPPERCASE_ERROR = sys.intern('Password must contain at least one uppercase letter')
+LOWERCASE_ERROR = sys.intern('Password must contain at least one lowercase letter')
+NUMBERS_ERROR = sys.intern('Password must contain at least one number')
+SYMBOLS_ERROR = sys.intern('Password must contain at least one symbol')
+COMMON_PATTERNS_ERROR = sys.intern('Password contains common weak patterns')
+SEQUENTIAL_ERROR = sys.intern('Password contains sequential characters')
+
+
+@dataclass(frozen=True)
 class PolicyRule:
     """
     Individual password policy rule.
+    
+    Frozen so that instances cached by PasswordPolicy can be shared.
+    Slots are declared by hand since dataclass(slots=True) needs 3.10+,
+    along with the state hooks it would generate for pickle and copy.
     """
+    __slots__ = ('name', 'description', 'enabled', 'error_message')
+    
     name: str
     description: str
     enabled: bool
     error_message: str
+    
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, field.name) for field in fields(self))
+    
+    def __setstate__(self, state: Tuple) -> None:
+        # Bypass the frozen __setattr__, as dataclass(slots=True) does
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
 
 
+@dataclass(frozen=True)
 class PasswordPolicy:
     """
     Configurable password policy for web applications.
     Defines security requirements and validation rules.
+    
+    Frozen: a policy never changes after construction, so its rule list
+    is built once and policies are hashable.
+    
+    Attributes:
+        min_length: Minimum password length
+        max_length: Maximum password length
+        require_uppercase: Require uppercase letters
+        require_lowercase: Require lowercase letters
+        require_numbers: Require numbers
+        require_symbols: Require symbols
+        min_entropy: Minimum entropy in bits
+        forbid_common_patterns: Reject common patterns
+        forbid_sequential: Reject sequential patterns
     """
+    min_length: int = DEFAULT_POLICY_MIN_LENGTH
+    max_length: int = DEFAULT_POLICY_MAX_LENGTH
+    require_uppercase: bool = DEFAULT_REQUIRE_UPPERCASE
+    require_lowercase: bool = DEFAULT_REQUIRE_LOWERCASE
+    require_numbers: bool = DEFAULT_REQUIRE_NUMBERS
+    require_symbols: bool = DEFAULT_REQUIRE_SYMBOLS
+    min_entropy: Optional[float] = None
+    forbid_common_patterns: bool = True
+    forbid_sequential: bool = True
+    
+    def get_rules(self) -> list:
+        """
+        Get list of all policy rules.
+        
+        Returns:
+            List of PolicyRule objects
+        """
+        return list(self._rules)
     
-    def __init__(self,
-                 min_length: int = DEFAULT_POLICY_MIN_LENGTH,
-                 max_length: int = DEFAULT_POLICY_MAX_LENGTH,
-                 require_uppercase: bool = DEFAULT_REQUIRE_UPPERCASE,
-                 require_lowercase: bool = DEFAULT_REQUIRE_LOWERCASE,
-                 require_numbers: bool = DEFAULT_REQUIRE_NUMBERS,
-                 require_symbols: bool = DEFAULT_REQUIRE_SYMBOLS,
-                 min_entropy: Optional[float] = None,
-                 forbid_common_patterns: bool = True,
-                 forbid_sequential: bool = True):
+    def iter_rules(self) -> Iterator[PolicyRule]:
         """
-        Initialize password policy.
+        Iterate over policy rules without building a list.
         
-        Args:
-            min_length: Minimum password length
-            max_length: Maximum password length
-            require_uppercase: Require uppercase letters
-            require_lowercase: Require lowercase letters
-            require_numbers: Require numbers
-            require_symbols: Require symbols
-            min_entropy: Minimum entropy in bits
-            forbid_common_patterns: Reject common patterns
-            forbid_sequential: Reject sequential patterns
+        Returns:
+            Iterator of PolicyRule objects
         """
-        self.min_length = min_length
-        self.max_length = max_length
-        self.require_uppercase = require_uppercase
-        self.require_lowercase = require_lowercase
-        self.require_numbers = require_numbers
-        self.require_symbols = require_symbols
-        self.min_entropy = min_entropy
-        self.forbid_common_patterns = forbid_common_patterns
-        self.forbid_sequential = forbid_sequential
+        return iter(self._rules)
     
-    def get_rules(self) -> list:
+    @cached_property
+    def _rules(self) -> Tuple[PolicyRule, ...]:
+        """Rules for this policy, built on first access."""
+        return tuple(self._build_rules())
+    
+    def _build_rules(self) -> list:
         """
-        Get list of all policy rules.
+        Build policy rules from the current settings.
         
         Returns:
             List of PolicyRule objects
@@ -87,7 +125,7 @@ class PasswordPolicy:
                 name='uppercase',
                 description='At least one uppercase letter',
                 enabled=True,
-                error_message='Password must contain at least one uppercase letter'
+                error_message=UPPERCASE_ERROR
             ))
         
         if self.require_lowercase:
@@ -95,7 +133,7 @@ class PasswordPolicy:
                 name='lowercase',
                 description='At least one lowercase letter',
                 enabled=True,
-                error_message='Password must contain at least one lowercase letter'
+                error_message=LOWERCASE_ERROR
             ))
         
         if self.require_numbers:
@@ -103,7 +141,7 @@ class PasswordPolicy:
                 name='numbers',
                 description='At least one number',
                 enabled=True,
-                error_message='Password must contain at least one number'
+                error_message=NUMBERS_ERROR
             ))
         
         if self.require_symbols:
@@ -111,7 +149,7 @@ class PasswordPolicy:
                 name='symbols',
                 description='At least one symbol',
                 enabled=True,
-                error_message='Password must contain at least one symbol'
+                error_message=SYMBOLS_ERROR
             ))
         
         if self.forbid_common_patterns:
@@ -119,21 +157,11 @@ class PasswordPolicy:
                 name='no_common_patterns',
                 description='No common weak patterns',
                 enabled=True,
-                error_message='Password contains common weak patterns'
+                error_message=COMMON_PATTERNS_ERROR
             ))
         
         return rules
     
     def to_dict(self) -> dict:
         """Convert policy to dictionary."""
-        return {
-            'min_length': self.min_length,
-            'max_length': self.max_length,
-            'require_uppercase': self.require_uppercase,
-            'require_lowercase': self.require_lowercase,
-            'require_numbers': self.require_numbers,
-            'require_symbols': self.require_symbols,
-            'min_entropy': self.min_entropy,
-            'forbid_common_patterns': self.forbid_common_patterns,
-            'forbid_sequential': self.forbid_sequential
-        }
+        return asdict(self)
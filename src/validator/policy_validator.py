@@ -3,9 +3,126 @@ Password policy validator.
 Validates passwords against configurable security policies.
 """
 
-from typing import Dict, List
-from .policy_rules import PasswordPolicy
+import string
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from .policy_rules import (
+    PasswordPolicy,
+    UPPERCASE_ERROR,
+    LOWERCASE_ERROR,
+    NUMBERS_ERROR,
+    SYMBOLS_ERROR,
+    COMMON_PATTERNS_ERROR,
+    SEQUENTIAL_ERROR
+)
 from ..analyzer.password_analyzer import PasswordAnalyzer
+from ..core.digest_cache import DigestCache
+from config.settings import VALIDATION_CACHE_SIZE
+
+# ASCII character classes for the set-based fast path in _char_classes
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+
+
+# Shared empty message tuple for results without errors or warnings
+_NO_MESSAGES: Tuple[str, ...] = ()
+
+_WEAK_WARNING = sys.intern('Password is weak. Consider making it stronger.')
+_SYMBOLS_WARNING = sys.intern('Adding symbols would significantly improve strength')
+
+# Warning tuples for a valid password, by (is weak, lacks symbols)
+_WARNINGS = {
+    (False, False): _NO_MESSAGES,
+    (True, False): (_WEAK_WARNING,),
+    (False, True): (_SYMBOLS_WARNING,),
+    (True, True): (_WEAK_WARNING, _SYMBOLS_WARNING),
+}
+
+
+# Analyzer shared by validators constructed without one; built on first use
+_shared_analyzer: Optional[PasswordAnalyzer] = None
+_shared_analyzer_lock = threading.Lock()
+
+
+def _get_shared_analyzer() -> PasswordAnalyzer:
+    """Get the shared default PasswordAnalyzer, creating it if needed."""
+    global _shared_analyzer
+    with _shared_analyzer_lock:
+        if _shared_analyzer is None:
+            _shared_analyzer = PasswordAnalyzer()
+        return _shared_analyzer
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """
+    Outcome of validating one password against a policy.
+    
+    Frozen with tuple fields, so cached results can be shared safely.
+    
+    A password rejected by the length limits alone is not analyzed; its
+    result has score 0 and strength 'Invalid' rather than an assessment.
+    """
+    valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    score: int
+    strength: str
+    
+    def to_dict(self) -> dict:
+        """Convert result to a JSON-ready dictionary."""
+        return {
+            'valid': self.valid,
+            'errors': list(self.errors),
+            'warnings': list(self.warnings),
+            'score': self.score,
+            'strength': self.strength
+        }
+
+
+def _char_classes(password: str,
+                  wanted: Tuple[bool, bool, bool, bool]
+                  ) -> Tuple[bool, bool, bool, bool]:
+    """
+    Detect character classes present in a password.
+    
+    Args:
+        password: Password to scan (not stored)
+        wanted: Which of (upper, lower, digit, symbol) to check
+    
+    Returns:
+        (has_upper, has_lower, has_digit, has_symbol), where symbol means
+        any non-alphanumeric character; classes not wanted report True
+    
+    Note: Only wanted classes are scanned. ASCII passwords are classified
+    with one set build and C-level set probes that stop at the first hit;
+    others keep the Unicode-aware str predicates, short-circuiting via any().
+    """
+    want_upper, want_lower, want_digit, want_symbol = wanted
+    
+    # Whole-string predicate: false only if every character is alphanumeric
+    has_symbol = (
+        not want_symbol or (bool(password) and not password.isalnum())
+    )
+    
+    if password.isascii():
+        chars = set(password)
+        return (
+            not want_upper or not chars.isdisjoint(_ASCII_UPPER),
+            not want_lower or not chars.isdisjoint(_ASCII_LOWER),
+            not want_digit or not chars.isdisjoint(_ASCII_DIGITS),
+            has_symbol
+        )
+    
+    return (
+        not want_upper or any(c.isupper() for c in password),
+        not want_lower or any(c.islower() for c in password),
+        not want_digit or any(c.isdigit() for c in password),
+        has_symbol
+    )
 
 
 class PolicyValidator:
@@ -13,17 +130,92 @@ class PolicyValidator:
     Validates passwords against security policies.
     """
     
-    def __init__(self, policy: PasswordPolicy):
+    def __init__(self, policy: PasswordPolicy,
+                 analyzer: Optional[PasswordAnalyzer] = None,
+                 cache_size: int = VALIDATION_CACHE_SIZE):
         """
         Initialize validator with policy.
         
         Args:
             policy: PasswordPolicy instance
+            analyzer: PasswordAnalyzer to use (shared default if omitted)
+            cache_size: Maximum cached results (0 disables caching)
         """
         self.policy = policy
-        self.analyzer = PasswordAnalyzer()
+        self._analyzer = analyzer
+        
+        self._cache: DigestCache[ValidationResult] = DigestCache(cache_size)
+        self._bind_policy(policy)
+    
+    def _bind_policy(self, policy: PasswordPolicy) -> None:
+        """
+        Precompute the checks a policy enables and reset cached results.
+        
+        Args:
+            policy: PasswordPolicy now in effect
+        """
+        self._bound_policy = policy
+        self._min_length = policy.min_length
+        self._max_length = policy.max_length
+        self._min_entropy = policy.min_entropy
+        self._suggest_symbols = not policy.require_symbols
+        self._too_short_message = (
+            f'Password must be at least {policy.min_length} characters'
+        )
+        self._too_long_message = (
+            f'Password must not exceed {policy.max_length} characters'
+        )
+        
+        # Classes to scan for, in _char_classes order
+        self._wanted_classes = (
+            policy.require_uppercase,
+            policy.require_lowercase,
+            policy.require_numbers,
+            policy.require_symbols,
+        )
+        
+        # (index into _char_classes result, error) for each required class
+        self._class_checks = tuple(
+            (index, message)
+            for index, (required, message) in enumerate(zip(
+                self._wanted_classes,
+                (UPPERCASE_ERROR, LOWERCASE_ERROR, NUMBERS_ERROR, SYMBOLS_ERROR)
+            ))
+            if required
+        )
+        
+        # (analysis key, error) for each forbidden pattern type
+        self._pattern_checks = tuple(
+            (key, message)
+            for forbidden, key, message in (
+                (policy.forbid_common_patterns, 'has_common_patterns',
+                 COMMON_PATTERNS_ERROR),
+                (policy.forbid_sequential, 'has_sequential', SEQUENTIAL_ERROR),
+            )
+            if forbidden
+        )
+        
+        # Results are only valid for the policy they were computed under
+        self._cache.clear()
+    
+    @property
+    def analyzer(self) -> PasswordAnalyzer:
+        """Analyzer in use; the shared default is created on first access."""
+        if self._analyzer is None:
+            self._analyzer = _get_shared_analyzer()
+        return self._analyzer
     
-    def validate(self, password: str) -> Dict:
+    @analyzer.setter
+    def analyzer(self, analyzer: PasswordAnalyzer) -> None:
+        # Cached results carry the old analyzer's scores and pattern errors
+        self._analyzer = analyzer
+        self._cache.clear()
+    
+    def clear_cache(self) -> None:
+        """Drop all cached validation results."""
+        self._cache.clear()
+    
+    def validate(self, password: str) -> ValidationResult:
         """
         Validate password against policy.
         
@@ -31,69 +223,101 @@ class PolicyValidator:
             password: Password to validate (not stored)
         
         Returns:
-            Dict with:
-                - valid: bool
-                - errors: List[str]
-                - warnings: List[str]
+            ValidationResult with valid, errors, warnings, score, strength
+        
+        Note: A password failing the length limits is rejected without
+        analysis; only the length error is reported, with score 0 and
+        strength 'Invalid'.
         
         Security: Password validated in-place, never stored.
         """
-        errors = []
-        warnings = []
+        if self.policy is not self._bound_policy:
+            self._bind_policy(self.policy)
         
-        # Basic length check
-        if len(password) < self.policy.min_length:
-            errors.append(
-                f'Password must be at least {self.policy.min_length} characters'
-            )
+        return self._cache.get_or_compute(password, self._validate)
+    
+    def validate_many(self, passwords: List[str]) -> List[ValidationResult]:
+        """
+        Validate a batch of passwords.
         
-        if len(password) > self.policy.max_length:
-            errors.append(
-                f'Password must not exceed {self.policy.max_length} characters'
-            )
+        Each distinct password is validated once. Results are immutable,
+        so duplicates in the batch reuse the same ValidationResult.
+        
+        Args:
+            passwords: Passwords to validate (not stored)
+        
+        Returns:
+            List of ValidationResults in input order
+        """
+        results: Dict[str, ValidationResult] = {}
+        for password in passwords:
+            if password not in results:
+                results[password] = self.validate(password)
         
-        # Character type requirements
-        if self.policy.require_uppercase and not any(c.isupper() for c in password):
-            errors.append('Password must contain at least one uppercase letter')
+        return [results[password] for password in passwords]
+    
+    def _validate(self, password: str) -> ValidationResult:
+        """
+        Validate password against policy, uncached.
         
-        if self.policy.require_lowercase and not any(c.islower() for c in password):
-            errors.append('Password must contain at least one lowercase letter')
+        Args:
+            password: Password to validate (not stored)
         
-        if self.policy.require_numbers and not any(c.isdigit() for c in password):
-            errors.append('Password must contain at least one number')
+        Returns:
+            ValidationResult as described in validate()
+        """
+        errors = []
         
-        if self.policy.require_symbols and not any(not c.isalnum() for c in password):
-            errors.append('Password must contain at least one symbol')
+        # Basic length check
+        length = len(password)
+        if length < self._min_length:
+            errors.append(self._too_short_message)
+        
+        if length > self._max_length:
+            errors.append(self._too_long_message)
+        
+        # Length failures are final; skip the class checks and analysis
+        if errors:
+            return ValidationResult(
+                False, tuple(errors), _NO_MESSAGES, 0, 'Invalid'
+            )
+        
+        # Character type requirements (scans only the required classes)
+        if self._class_checks:
+            classes = _char_classes(password, self._wanted_classes)
+            for index, message in self._class_checks:
+                if not classes[index]:
+                    errors.append(message)
         
         # Analyze for patterns and entropy
         analysis = self.analyzer.analyze(password)
+        score = analysis['score']
+        strength = analysis['strength']
         
         # Pattern checks
-        if self.policy.forbid_common_patterns and analysis.get('has_common_patterns'):
-            errors.append('Password contains common weak patterns')
-        
-        if self.policy.forbid_sequential and analysis.get('has_sequential'):
-            errors.append('Password contains sequential characters')
+        for key, message in self._pattern_checks:
+            if analysis.get(key):
+                errors.append(message)
         
         # Entropy check
-        if self.policy.min_entropy and analysis['entropy'] < self.policy.min_entropy:
-            errors.append(
-                f'Password entropy too low '
-                f'({analysis["entropy"]:.1f} < {self.policy.min_entropy} bits)'
+        min_entropy = self._min_entropy
+        if min_entropy:
+            entropy = analysis['entropy']
+            if entropy < min_entropy:
+                errors.append(
+                    f'Password entropy too low '
+                    f'({entropy:.1f} < {min_entropy} bits)'
+                )
+        
+        if errors:
+            return ValidationResult(
+                False, tuple(errors), _NO_MESSAGES, score, strength
             )
         
         # Generate warnings for weak but valid passwords
-        if not errors:
-            if analysis['score'] < 60:
-                warnings.append('Password is weak. Consider making it stronger.')
-            
-            if not self.policy.require_symbols and not analysis['has_symbols']:
-                warnings.append('Adding symbols would significantly improve strength')
+        weak = score < 60
+        no_symbols = self._suggest_symbols and not analysis['has_symbols']
         
-        return {
-            'valid': len(errors) == 0,
-            'errors': errors,
-            'warnings': warnings,
-            'score': analysis['score'],
-            'strength': analysis['strength']
-        }
\ No newline at end of file
+        return ValidationResult(
+            True, _NO_MESSAGES, _WARNINGS[weak, no_symbols], score, strength
+        )
\ No newline at end of file
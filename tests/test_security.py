@@ -0,0 +1,128 @@
+"""
+Tests for the CSPRNG helpers in src.core.security.
+"""
+
+import os
+import struct
+import unittest
+from collections import Counter
+from unittest import mock
+
+from src.core import security
+from src.core.security import (
+    secure_random_choice, secure_random_choices, secure_randints,
+    secure_shuffle
+)
+
+
+class SecureRandintsTest(unittest.TestCase):
+    """Bulk integer draws stay in range at every lane boundary."""
+    
+    def test_bound_edges(self):
+        # One value per lane width, plus the randbelow fallback above 2**64
+        for bound in (1, 2, 255, 256, 257, 2**16, 2**16 + 1, 2**32,
+                      2**32 + 1, 2**64, 2**64 + 1):
+            values = secure_randints(200, bound)
+            self.assertEqual(len(values), 200)
+            self.assertTrue(all(0 <= v < bound for v in values), bound)
+        
+        self.assertEqual(secure_randints(50, 1), [0] * 50)
+    
+    def test_empty_and_invalid(self):
+        self.assertEqual(secure_randints(0, 10), [])
+        for bound in (0, -1):
+            with self.assertRaises(ValueError):
+                secure_randints(1, bound)
+    
+    def test_distribution(self):
+        # 257 rejects most of each 16-bit lane's top range; all must appear
+        counts = Counter(secure_randints(257 * 200, 257))
+        self.assertEqual(set(counts), set(range(257)))
+        
+        counts = Counter(secure_randints(30000, 3))
+        self.assertTrue(all(9000 < c < 11000 for c in counts.values()), counts)
+
+
+class SecureRandomChoicesTest(unittest.TestCase):
+    """Character picks cover the byte-table path and the integer fallback."""
+    
+    def test_zero_and_empty(self):
+        self.assertEqual(secure_random_choices('abc', 0), [])
+        with self.assertRaises(ValueError):
+            secure_random_choices('', 1)
+        with self.assertRaises(ValueError):
+            secure_random_choice('')
+    
+    def test_ascii(self):
+        chosen = secure_random_choices('abc', 3000)
+        self.assertEqual(len(chosen), 3000)
+        self.assertEqual(set(chosen), set('abc'))
+        self.assertIn(secure_random_choice('abc'), 'abc')
+    
+    def test_non_ascii_fallback(self):
+        sequence = 'αβγδεz'
+        chosen = secure_random_choices(sequence, 3000)
+        self.assertEqual(len(chosen), 3000)
+        self.assertEqual(set(chosen), set(sequence))
+    
+    def test_long_sequence_fallback(self):
+        sequence = ''.join(chr(0x4e00 + i) for i in range(300))
+        chosen = secure_random_choices(sequence, 6000)
+        self.assertEqual(len(chosen), 6000)
+        self.assertTrue(set(chosen) <= set(sequence))
+        self.assertGreater(len(set(chosen)), 250)
+        self.assertIn(secure_random_choice(sequence), sequence)
+
+
+class SecureShuffleTest(unittest.TestCase):
+    """Shuffles are permutations and never order on tied keys."""
+    
+    def test_permutation(self):
+        items = list(range(100))
+        shuffled = secure_shuffle(items)
+        self.assertEqual(sorted(shuffled), items)
+        self.assertEqual(items, list(range(100)))
+    
+    def test_tied_keys_are_redrawn(self):
+        tied = bytes(8 * 4)
+        distinct = struct.pack('<4Q', 3, 1, 4, 2)
+        with mock.patch.object(security, '_random_bytes',
+                               side_effect=[tied, distinct]) as draw:
+            self.assertEqual(secure_shuffle(['a', 'b', 'c', 'd']),
+                             ['b', 'd', 'a', 'c'])
+        self.assertEqual(draw.call_count, 2)
+
+
+class EntropyPoolTest(unittest.TestCase):
+    """Pooled bytes are handed out once, and never shared with a child."""
+    
+    def test_consumed_bytes_are_wiped(self):
+        security._random_bytes(16)
+        pool = security._entropy_pool
+        self.assertEqual(bytes(pool.buffer[:pool.offset]), bytes(pool.offset))
+    
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_resets_pool(self):
+        # Leave unused bytes in the pool for the child to inherit
+        security._random_bytes(1)
+        
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                os.write(write_fd, security._random_bytes(32))
+            finally:
+                os._exit(0)
+        
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            child_bytes = pipe.read()
+        os.waitpid(pid, 0)
+        
+        self.assertEqual(len(child_bytes), 32)
+        self.assertNotEqual(child_bytes, security._random_bytes(32))
+
+
+if __name__ == '__main__':
+    unittest.main()
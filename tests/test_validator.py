@@ -0,0 +1,69 @@
+"""
+Tests for password policy validation.
+"""
+
+import copy
+import pickle
+import unittest
+
+from src.analyzer import PasswordAnalyzer
+from src.validator import (
+    PasswordPolicy, PolicyRule, PolicyValidator, ValidationResult
+)
+
+
+class StateRoundTripTest(unittest.TestCase):
+    """Frozen policy objects must survive pickle and copy round trips."""
+    
+    def assertRoundTrips(self, obj):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(obj, protocol)), obj)
+        self.assertEqual(copy.copy(obj), obj)
+        self.assertEqual(copy.deepcopy(obj), obj)
+    
+    def test_policy_rule(self):
+        self.assertRoundTrips(
+            PolicyRule('min_length', 'At least 8 characters', True, 'Too short')
+        )
+        self.assertRoundTrips(PasswordPolicy().get_rules())
+    
+    def test_validation_result(self):
+        validator = PolicyValidator(PasswordPolicy())
+        for password in ('Tr0ub4dor&3xyz', 'short'):
+            result = validator.validate(password)
+            self.assertIsInstance(result, ValidationResult)
+            self.assertRoundTrips(result)
+
+
+class LengthRejectionTest(unittest.TestCase):
+    """Length failures are reported without a strength assessment."""
+    
+    def test_rejected_lengths_are_marked_invalid(self):
+        validator = PolicyValidator(PasswordPolicy(min_length=8, max_length=16))
+        for password in ('Ab1!', 'Ab1!' * 10):
+            result = validator.validate(password)
+            self.assertFalse(result.valid)
+            self.assertEqual(len(result.errors), 1)
+            self.assertEqual((result.score, result.strength), (0, 'Invalid'))
+
+
+class AnalyzerSwapTest(unittest.TestCase):
+    """Replacing the analyzer must not serve results from the old one."""
+    
+    def test_setter_clears_cached_results(self):
+        class FixedAnalyzer(PasswordAnalyzer):
+            def analyze(self, password):
+                analysis = dict(super().analyze(password))
+                analysis['score'] = 1
+                return analysis
+        
+        validator = PolicyValidator(PasswordPolicy())
+        password = 'Tr0ub4dor&3xyz'
+        self.assertNotEqual(validator.validate(password).score, 1)
+        
+        validator.analyzer = FixedAnalyzer()
+        self.assertEqual(validator.validate(password).score, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
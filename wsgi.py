@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production servers.
+
+Example:
+    gunicorn --workers 4 --threads 4 wsgi:app
+"""
+
+from app import create_app
+
+app = create_app()